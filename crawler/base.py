@@ -4,12 +4,17 @@ Abstract base crawler that wraps Selenium driver management and parsing helpers.
 
 from __future__ import annotations
 
+import random
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Protocol, TypeVar
+from typing import Any, Callable, Iterable, Protocol, Sequence, TypeVar
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from . import driver as driver_module
@@ -33,8 +38,42 @@ except ImportError:
     _tqdm = None
 
 
+try:  # lxml is much faster than the pure-Python parser when it is installed
+    from lxml import etree as _etree
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover
+    _etree = None
+    HTML_PARSER = "html.parser"
+
+
 def progress_bar(iterable: Iterable[T], **kwargs) -> Iterable[T]:
-    return _tqdm(iterable, **kwargs) if _tqdm else iterable
+    """
+    Wrap `iterable` in a tqdm bar that redraws at most twice a second.
+
+    Nested bars (`leave=False`) are switched off when stderr is not a terminal, so
+    redirected logs only carry the outer bar.
+    """
+
+    if not _tqdm:
+        return iterable
+    kwargs.setdefault("mininterval", 0.5)
+    kwargs.setdefault("smoothing", 0.3)
+    if kwargs.get("leave") is False:
+        kwargs.setdefault("disable", not sys.stderr.isatty())
+    return _tqdm(iterable, **kwargs)
+
+
+def class_strainer(tags: str | list[str], classes: Iterable[str]) -> SoupStrainer:
+    """
+    Build a SoupStrainer that keeps `tags` carrying any of `classes` (plus their subtree).
+
+    During parsing the class attribute is still the raw string, so a plain `class_=`
+    match would miss elements that have more than one class.
+    """
+
+    wanted = frozenset(classes)
+    return SoupStrainer(tags, class_=lambda value: bool(value) and not wanted.isdisjoint(value.split()))
 
 
 class BaseCrawler:
@@ -53,12 +92,17 @@ class BaseCrawler:
         delay: float = 1.5,
         use_selenium: bool = True,
         request_headers: dict[str, str] | None = None,
+        max_workers: int = 8,
+        driver_pool: driver_module.DriverPool | None = None,
     ):
         self.delay = delay
+        self.max_workers = max_workers
         self.use_selenium = use_selenium
+        self.driver_pool = driver_pool if use_selenium else None
         self._driver_provided = driver is not None
         self.driver = None
         self.session: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self.request_headers = request_headers or {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -66,14 +110,38 @@ class BaseCrawler:
             )
         }
 
-        if self.use_selenium:
+        if not self.use_selenium:
+            self.session = self._build_session()
+        elif self.driver_pool is None:  # with a pool, drivers are leased per page load
             self.driver = driver or driver_module.build_chrome_driver(
                 headless=headless, block_images=block_images
             )
-        else:
-            self.session = requests.Session()
+
+    def _build_session(self) -> requests.Session:
+        """
+        Create a keep-alive session whose pool covers the concurrent detail fetches.
+        """
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(32, self.max_workers),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.request_headers)
+        return session
 
     def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if self.use_selenium and self.driver and not self._driver_provided:
             self.driver.quit()
         if self.session:
@@ -85,23 +153,103 @@ class BaseCrawler:
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
         self.close()
 
-    def get_soup(self, url: str) -> BeautifulSoup:
+    def get_html(self, url: str) -> str:
         """
-        Load the URL through Selenium (default) or `requests` and return soup.
+        Load the URL through Selenium (default) or `requests` and return the page source.
         """
 
+        if self.driver_pool is not None:
+            with self.driver_pool.lease() as leased:
+                leased.get(url)
+                time.sleep(self.delay)
+                return leased.page_source
         if self.use_selenium:
             assert self.driver is not None
             self.driver.get(url)
             time.sleep(self.delay)
-            page_source = self.driver.page_source
-        else:
-            assert self.session is not None
-            response = self.session.get(url, headers=self.request_headers, timeout=20)
+            return self.driver.page_source
+
+        assert self.session is not None
+        response = self.session.get(url, timeout=20)
+        response.raise_for_status()
+        return response.text
+
+    def get_soup(self, url: str, *, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+        """
+        Load the URL and return soup.
+
+        Pass `parse_only` to build the tree from the matching subtrees only.
+        """
+
+        return BeautifulSoup(self.get_html(url), HTML_PARSER, parse_only=parse_only)
+
+    def get_html_streamed(self, url: str, target_tag: str, target_class: str) -> str:
+        """
+        Stream the page and return the HTML of the first `<target_tag class="target_class">`.
+
+        The body is fed to an incremental lxml parser and reading stops once that element
+        is closed, so trailing scripts/ads are neither downloaded in full nor parsed.
+        Selenium (or a missing lxml) returns the whole page source instead, so callers
+        must still select the element themselves.
+        """
+
+        if self.use_selenium or _etree is None:
+            return self.get_html(url)
+
+        assert self.session is not None
+        parser = _etree.HTMLPullParser(events=("end",), tag=target_tag)
+
+        def find_target():
+            for _, element in parser.read_events():
+                if target_class in (element.get("class") or "").split():
+                    return element
+            return None
+
+        target = None
+        with self.session.get(url, stream=True, timeout=20) as response:
             response.raise_for_status()
-            page_source = response.text
+            for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
+                parser.feed(chunk)
+                target = find_target()
+                if target is not None:
+                    break
+        if target is None:
+            parser.close()
+            target = find_target()
+        if target is None:
+            return ""
+        return _etree.tostring(target, encoding="unicode", method="html", with_tail=False)
+
+    def map_concurrent(self, func: Callable[..., T], tasks: Sequence[dict[str, Any]]) -> list[T]:
+        """
+        Call `func(**task)` for every task and return the results in task order.
+
+        Detail pages are independent network round-trips, so with `requests` (or a
+        driver pool) they are fetched on a thread pool; a single Selenium driver is not
+        thread-safe, so that path (and `max_workers <= 1`) stays sequential.
+        """
+
+        single_driver = self.use_selenium and self.driver_pool is None
+        if single_driver or self.max_workers <= 1 or len(tasks) <= 1:
+            return [func(**task) for task in tasks]
+
+        def run(task: dict[str, Any]) -> T:
+            # Stagger requests a little so concurrency does not turn into a burst.
+            time.sleep(random.uniform(0, self.delay))
+            return func(**task)
 
-        return BeautifulSoup(page_source, "html.parser")
+        return list(self._get_executor().map(run, tasks))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Lazily create the worker pool reused by every `map_concurrent` call until `close()`.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"{self.site_name}-fetch"
+            )
+        return self._executor
 
     def crawl(self, *args, **kwargs) -> CrawlResult:  # pragma: no cover - interface method
         raise NotImplementedError
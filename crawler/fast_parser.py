@@ -0,0 +1,33 @@
+"""
+Optional selectolax (lexbor) fast path for plain CSS selection on list pages.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:  # Optional because BeautifulSoup already covers every page
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover
+    LexborHTMLParser = None
+
+AVAILABLE = LexborHTMLParser is not None
+
+
+def parse(html: str, selector: str) -> list[Any]:
+    """
+    Return the lexbor nodes matching `selector`; only call when `AVAILABLE`.
+    """
+
+    assert LexborHTMLParser is not None
+    return LexborHTMLParser(html).css(selector)
+
+
+def text(node: Any | None, *, separator: str = "") -> str | None:
+    """
+    Mirror `Tag.get_text(separator, strip=True)` for a lexbor node (None passes through).
+    """
+
+    if node is None:
+        return None
+    return node.text(separator=separator, strip=True)
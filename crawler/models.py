@@ -4,7 +4,7 @@ Dataclasses shared by multiple crawlers for consistent serialization.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -15,7 +15,7 @@ def _serialize_dt(value: datetime | None) -> str | None:
     return value.isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     site: str
     source_id: str
@@ -25,12 +25,17 @@ class Comment:
     meta: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        data["posted_at"] = _serialize_dt(self.posted_at)
-        return data
+        return {
+            "site": self.site,
+            "source_id": self.source_id,
+            "author": self.author,
+            "content": self.content,
+            "posted_at": _serialize_dt(self.posted_at),
+            "meta": dict(self.meta),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     site: str
     gallery: str
@@ -45,7 +50,16 @@ class Post:
     comments: list[Comment] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        data["posted_at"] = _serialize_dt(self.posted_at)
-        data["comments"] = [comment.to_dict() for comment in self.comments]
-        return data
+        return {
+            "site": self.site,
+            "gallery": self.gallery,
+            "source_id": self.source_id,
+            "url": self.url,
+            "title": self.title,
+            "content": self.content,
+            "author": self.author,
+            "posted_at": _serialize_dt(self.posted_at),
+            "comment_count": self.comment_count,
+            "meta": dict(self.meta),
+            "comments": [comment.to_dict() for comment in self.comments],
+        }
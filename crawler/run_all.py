@@ -4,38 +4,53 @@ Utility script that crawls multiple communities and exports the results.
 
 from __future__ import annotations
 
+from .driver import DriverPool
 from .sites import DCInsideCrawler, GalleryConfig, InstizBoardConfig, InstizCrawler
 from .storage import export_by_source
 
 
-def crawl_dcinside() -> None:
+def _crawler_kwargs(driver_pool: DriverPool | None) -> dict:
+    # Crawl through the shared Selenium pool when one is given, otherwise via requests.
+    if driver_pool is None:
+        return {}
+    return {"use_selenium": True, "driver_pool": driver_pool}
+
+
+def crawl_dcinside(driver_pool: DriverPool | None = None, *, ndjson: bool = False) -> None:
     galleries = [
         GalleryConfig(gallery_id="programming", name="프로그래밍 갤러리", max_pages=2),
         # GalleryConfig(gallery_id="hit", name="HIT", max_pages=1),
     ]
 
-    with DCInsideCrawler() as crawler:
+    with DCInsideCrawler(**_crawler_kwargs(driver_pool)) as crawler:
         result = crawler.crawl(galleries)
 
-    paths = export_by_source(posts=result.posts, comments=result.comments)
+    paths = export_by_source(posts=result.posts, comments=result.comments, ndjson=ndjson)
     print("[DCInside] 저장 완료:", {k: {kk: str(vv) for kk, vv in val.items()} for k, val in paths.items()})
 
 
-def crawl_instiz() -> None:
+def crawl_instiz(driver_pool: DriverPool | None = None, *, ndjson: bool = False) -> None:
     boards = [
         InstizBoardConfig(board="pt", max_pages=2),
     ]
 
-    with InstizCrawler() as crawler:
+    with InstizCrawler(**_crawler_kwargs(driver_pool)) as crawler:
         result = crawler.crawl(boards)
 
-    paths = export_by_source(posts=result.posts, comments=result.comments)
+    paths = export_by_source(posts=result.posts, comments=result.comments, ndjson=ndjson)
     print("[Instiz] 저장 완료:", {k: {kk: str(vv) for kk, vv in val.items()} for k, val in paths.items()})
 
 
-def main() -> None:
-    crawl_dcinside()
-    crawl_instiz()
+def main(use_selenium: bool = False, ndjson: bool = False) -> None:
+    if not use_selenium:
+        crawl_dcinside(ndjson=ndjson)
+        crawl_instiz(ndjson=ndjson)
+        return
+
+    # One pool of warm browsers serves both crawlers instead of a fresh Chrome per crawler.
+    with DriverPool(size=2) as pool:
+        crawl_dcinside(pool, ndjson=ndjson)
+        crawl_instiz(pool, ndjson=ndjson)
 
 
 if __name__ == "__main__":
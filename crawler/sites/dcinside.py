@@ -4,25 +4,96 @@ Crawler for DCInside galleries.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Sequence
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
 
 from requests import RequestException
 
-from ..base import BaseCrawler, CrawlResult, progress_bar
+from .. import fast_parser
+from ..base import HTML_PARSER, BaseCrawler, CrawlResult, class_strainer, progress_bar
 from ..models import Comment, Post
 
 DATE_FORMAT = "%Y.%m.%d %H:%M:%S"
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+LIST_ROWS_SELECTOR = "table.gall_list tbody tr.ub-content"
+
+# Selectors compiled once instead of per select() call.
+_SEL_ROWS = sv.compile(LIST_ROWS_SELECTOR)
+_SEL_TITLE = sv.compile("span.title_subject")
+_SEL_CONTENT = sv.compile("div.write_div")
+_SEL_NICK = sv.compile("span.nickname")
+_SEL_DATE = sv.compile("span.gall_date")
+_SEL_VIEWS = sv.compile("span.gall_count")
+_SEL_RECOMMENDS = sv.compile("span.gall_reply_num")
+_SEL_COMMENTS = sv.compile("li.ub-content")
+_SEL_COMMENT_TEXT = sv.compile("p.usertxt")
+_SEL_COMMENT_REPLY = sv.compile("div.reply-content")
+_SEL_COMMENT_NICK = sv.compile("span.nick")
+_SEL_COMMENT_IP = sv.compile("span.ip")
+_SEL_COMMENT_DATE = sv.compile("span.date_time")
+# Only the post/comment nodes on detail pages are read.
+_DETAIL_CLASSES = ["title_subject", "write_div", "nickname", "gall_date", "gall_count", "gall_reply_num"]
+DETAIL_STRAINER = class_strainer(["span", "div", "li"], [*_DETAIL_CLASSES, "ub-content"])
+# Without comments the comment list items are not even built into the tree.
+DETAIL_STRAINER_NO_COMMENTS = class_strainer(["span", "div"], _DETAIL_CLASSES)
+
+
+# Numeric dates such as "2024.01.02 03:04:05", "24/01/02" or "2024-01-02 03:04:05".
+_DT_RE = re.compile(
+    r"(?P<y>\d{4}|\d{2})(?P<sep>[./-])(?P<mo>\d{1,2})(?P=sep)(?P<d>\d{1,2})"
+    r"(?:\s+(?P<H>\d{1,2}):(?P<M>\d{1,2}):(?P<S>\d{1,2}))?"
+)
+
+
+def _fast_datetime(value: str, separators: str) -> datetime | None:
+    """
+    Build the datetime straight from regex groups, skipping the strptime loop.
+
+    Returns None whenever the strptime fallback has to decide (unknown separator,
+    years that get the century patch, out-of-range fields), so results stay identical.
+    """
+
+    match = _DT_RE.fullmatch(value)
+    if not match or match["sep"] not in separators:
+        return None
+    year_text = match["y"]
+    # The only dashed format is "%Y-%m-%d %H:%M:%S".
+    if match["sep"] == "-" and (len(year_text) != 4 or match["H"] is None):
+        return None
+    year = int(year_text)
+    if len(year_text) == 2:
+        if year >= 69:
+            return None
+        year += 2000
+    elif year < 2000:
+        return None
+    try:
+        return datetime(
+            year,
+            int(match["mo"]),
+            int(match["d"]),
+            int(match["H"] or 0),
+            int(match["M"] or 0),
+            int(match["S"] or 0),
+        )
+    except ValueError:
+        return None
 
 
 def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
     value = value.strip()
+    dt = _fast_datetime(value, ".")
+    if dt:
+        return dt
     for fmt in (DATE_FORMAT, "%Y.%m.%d", "%y.%m.%d %H:%M:%S", "%y.%m.%d"):
         try:
             dt = datetime.strptime(value, fmt)
@@ -39,6 +110,9 @@ def _parse_list_range(value: str | None) -> datetime | None:
     if not value:
         return None
     value = value.strip()
+    dt = _fast_datetime(value, "./-")
+    if dt:
+        return dt
     now = datetime.now()
     patterns = [
         "%Y-%m-%d %H:%M:%S",
@@ -125,80 +199,67 @@ class DCInsideCrawler(BaseCrawler):
             range(config.start_page, config.start_page + config.max_pages),
             desc=f"[DCInside {label}] page",
             unit="page",
+            leave=False,
         )
 
         for page in page_iter:
             url = f"{self.BASE_URL}/board/lists/?id={config.gallery_id}&page={page}"
             try:
-                soup = self.get_soup(url)
+                fragment = self.get_html_streamed(url, "table", "gall_list")
             except RequestException:
                 continue
-            rows = soup.select("table.gall_list tbody tr.ub-content")
+            rows = _read_list_rows(fragment)
             if not rows:
                 break
 
+            tasks: list[dict] = []
+            queued_ids: set[str] = set()
             for row in rows:
-                data_type = row.get("data-type", "")
-                if data_type == "icon_notice":
+                if row is None:
                     continue
-                number_cell = row.find("td", class_="gall_num")
-                if not number_cell:
+                post_id = row["post_id"]
+                if not post_id or post_id in seen_ids or post_id in queued_ids or not post_id.isdigit():
                     continue
-                post_id = row.get("data-no") or number_cell.get_text(strip=True)
-                if not post_id or post_id in seen_ids or not post_id.isdigit():
+                href = row["href"]
+                if not href.startswith("/board/view/"):
                     continue
 
-                title_cell = row.find("td", class_="gall_tit")
-                anchor = title_cell.find("a", href=True) if title_cell else None
-                if not anchor:
+                date_text = row["date_text"]
+                list_date_text = row["date_title"] or date_text
+                list_date = _parse_list_range(list_date_text or date_text)
+                # Skip the detail fetch entirely when the list date is already out of range.
+                if start_dt and list_date and list_date < start_dt:
                     continue
-                href = anchor["href"]
-                if not href.startswith("/board/view/"):
+                if end_dt and list_date and list_date > end_dt:
                     continue
 
-                relative_date = row.find("td", class_="gall_date")
-                date_text = relative_date.get_text(strip=True) if relative_date else None
-                list_date_text = relative_date.get("title") if relative_date and relative_date.get("title") else date_text
-                list_date = _parse_list_range(list_date_text or date_text)
-                list_title = anchor.get_text(strip=True) if anchor else None
-                writer_cell = row.find("td", class_="gall_writer")
-                list_writer = None
-                list_writer_ip = None
-                list_writer_uid = None
-                if writer_cell:
-                    nickname = writer_cell.find("span", class_="nickname")
-                    list_writer = nickname.get_text(strip=True) if nickname else writer_cell.get_text(strip=True)
-                    ip_span = writer_cell.find("span", class_="ip")
-                    list_writer_ip = ip_span.get_text(strip=True) if ip_span else None
-                    list_writer_uid = writer_cell.get("data-uid") or writer_cell.get("user_id")
-                list_views_cell = row.find("td", class_="gall_count")
-                list_reco_cell = row.find("td", class_="gall_recommend")
-                reply_box = row.find("a", class_="reply_numbox")
-                reply_count = None
-                if reply_box:
-                    span = reply_box.find("span", class_="reply_num")
-                    if span:
-                        reply_count = _extract_int(span.get_text(strip=True))
-
-                detail_post, detail_comments = self._parse_post(
-                    config=config,
-                    post_id=post_id,
-                    relative_url=href,
-                    list_date=list_date,
-                    list_title=list_title,
-                    list_writer=list_writer,
-                    list_meta={
-                        "writer_ip": list_writer_ip,
-                        "writer_uid": list_writer_uid,
-                        "list_date_text": list_date_text,
-                        "list_views": _extract_int(list_views_cell.get_text(strip=True)) if list_views_cell else None,
-                        "list_recommendations": _extract_int(list_reco_cell.get_text(strip=True)) if list_reco_cell else None,
-                        "list_comment_count": reply_count,
-                    },
+                queued_ids.add(post_id)
+                tasks.append(
+                    {
+                        "config": config,
+                        "post_id": post_id,
+                        "relative_url": href,
+                        "list_date": list_date,
+                        "list_title": row["title"],
+                        "list_writer": row["writer"],
+                        "list_meta": {
+                            "writer_ip": row["writer_ip"],
+                            "writer_uid": row["writer_uid"],
+                            "list_date_text": list_date_text,
+                            "list_views": _extract_int(row["views_text"]),
+                            "list_recommendations": _extract_int(row["recommend_text"]),
+                            "list_comment_count": _extract_int(row["reply_text"]),
+                        },
+                    }
                 )
+
+            # Detail pages are fetched concurrently; results come back in list order.
+            for task, (detail_post, detail_comments) in zip(tasks, self.map_concurrent(self._parse_post, tasks)):
                 if not detail_post:
                     continue
 
+                post_id = task["post_id"]
+                list_date = task["list_date"]
                 post_dt = detail_post.posted_at or list_date
                 if start_dt and post_dt and post_dt < start_dt:
                     continue
@@ -224,28 +285,58 @@ class DCInsideCrawler(BaseCrawler):
         list_meta: dict | None,
     ) -> tuple[Post | None, list[Comment]]:
         detail_url = urljoin(self.BASE_URL, relative_url)
+        html = self._fetch_detail_html(detail_url)
+        if html is None:
+            return None, []
+        return self._parse_detail_html(
+            html,
+            config=config,
+            post_id=post_id,
+            detail_url=detail_url,
+            list_date=list_date,
+            list_title=list_title,
+            list_writer=list_writer,
+            list_meta=list_meta,
+        )
+
+    def _fetch_detail_html(self, detail_url: str) -> str | None:
         try:
-            soup = self.get_soup(detail_url)
+            return self.get_html(detail_url)
         except RequestException:
-            return None, []
-        title_node = soup.select_one("span.title_subject")
-        content_node = soup.select_one("div.write_div")
+            return None
+
+    def _parse_detail_html(
+        self,
+        html: str,
+        *,
+        config: GalleryConfig,
+        post_id: str,
+        detail_url: str,
+        list_date: datetime | None,
+        list_title: str | None,
+        list_writer: str | None,
+        list_meta: dict | None,
+    ) -> tuple[Post | None, list[Comment]]:
+        strainer = DETAIL_STRAINER if config.include_comments else DETAIL_STRAINER_NO_COMMENTS
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+        title_node = _SEL_TITLE.select_one(soup)
+        content_node = _SEL_CONTENT.select_one(soup)
         if not title_node or not content_node:
             return None, []
 
         title = title_node.get_text(strip=True) if title_node else (list_title or "")
         content = content_node.get_text("\n", strip=True)
-        author_node = soup.select_one("span.nickname")
+        author_node = _SEL_NICK.select_one(soup)
         author = author_node.get_text(strip=True) if author_node else list_writer
-        date_node = soup.select_one("span.gall_date")
+        date_node = _SEL_DATE.select_one(soup)
         posted_at = _parse_datetime(date_node.get_text(strip=True) if date_node else None) or list_date
 
-        view_node = soup.select_one("span.gall_count")
+        view_node = _SEL_VIEWS.select_one(soup)
         views = None
         if view_node:
             views = _extract_int(view_node.get_text(strip=True))
 
-        recommend_node = soup.select_one("span.gall_reply_num")
+        recommend_node = _SEL_RECOMMENDS.select_one(soup)
         recommends = None
         if recommend_node:
             recommends = _extract_int(recommend_node.get_text(strip=True))
@@ -270,19 +361,28 @@ class DCInsideCrawler(BaseCrawler):
             },
         )
 
-        comment_nodes = soup.select("li.ub-content")
+        if not config.include_comments:
+            # Comments are dropped by the caller anyway; keep the list page's count.
+            post.comment_count = (list_meta or {}).get("list_comment_count") or 0
+            return post, []
+
+        comment_nodes = _SEL_COMMENTS.select(soup)
         parsed_comments: list[Comment] = []
         for node in comment_nodes:
-            content_block = node.select_one("p.usertxt") or node.select_one("div.reply-content")
+            content_block = _SEL_COMMENT_TEXT.select_one(node) or _SEL_COMMENT_REPLY.select_one(node)
             if not content_block:
                 continue
             comment_text = content_block.get_text(" ", strip=True)
             if not comment_text:
                 continue
 
-            user_node = node.select_one("span.nickname") or node.select_one("span.nick") or node.select_one("span.ip")
+            user_node = (
+                _SEL_NICK.select_one(node)
+                or _SEL_COMMENT_NICK.select_one(node)
+                or _SEL_COMMENT_IP.select_one(node)
+            )
             comment_author = user_node.get_text(strip=True) if user_node else None
-            comment_date_text = node.select_one("span.date_time")
+            comment_date_text = _SEL_COMMENT_DATE.select_one(node)
             comment_dt = (
                 _parse_datetime(comment_date_text.get_text(strip=True))
                 if comment_date_text
@@ -308,8 +408,125 @@ class DCInsideCrawler(BaseCrawler):
         return post, parsed_comments
 
 
+def _read_list_rows(fragment: str) -> list[dict | None]:
+    """
+    Read every gallery list row into a plain dict (None for notices and malformed rows).
+
+    Uses the selectolax fast path when it is installed, BeautifulSoup otherwise.
+    """
+
+    if fast_parser.AVAILABLE:
+        return [_read_list_row_fast(row) for row in fast_parser.parse(fragment, LIST_ROWS_SELECTOR)]
+    soup = BeautifulSoup(fragment, HTML_PARSER)
+    return [_read_list_row(row) for row in _SEL_ROWS.select(soup)]
+
+
+def _read_list_row(row: Tag) -> dict | None:
+    if row.get("data-type", "") == "icon_notice":
+        return None
+    # One pass over the row's cells instead of a `row.find` scan per column.
+    cells: dict[str, Tag] = {}
+    for cell in row.find_all("td", recursive=False):
+        for class_name in cell.get("class") or ():
+            cells.setdefault(class_name, cell)
+    number_cell = cells.get("gall_num")
+    title_cell = cells.get("gall_tit")
+    # The title link and the comment-count box are both anchors in the title cell.
+    anchor = reply_box = None
+    for link in title_cell.find_all("a") if title_cell else ():
+        if anchor is None and link.has_attr("href"):
+            anchor = link
+        if reply_box is None and "reply_numbox" in (link.get("class") or ()):
+            reply_box = link
+    if not number_cell or not anchor:
+        return None
+
+    date_cell = cells.get("gall_date")
+    writer_cell = cells.get("gall_writer")
+    writer = writer_ip = writer_uid = None
+    if writer_cell:
+        spans: dict[str, Tag] = {}
+        for span in writer_cell.find_all("span"):
+            for class_name in span.get("class") or ():
+                spans.setdefault(class_name, span)
+        nickname = spans.get("nickname")
+        writer = nickname.get_text(strip=True) if nickname else writer_cell.get_text(strip=True)
+        ip_span = spans.get("ip")
+        writer_ip = ip_span.get_text(strip=True) if ip_span else None
+        writer_uid = writer_cell.get("data-uid") or writer_cell.get("user_id")
+    views_cell = cells.get("gall_count")
+    recommend_cell = cells.get("gall_recommend")
+    reply_span = reply_box.find("span", class_="reply_num") if reply_box else None
+
+    return {
+        "post_id": row.get("data-no") or number_cell.get_text(strip=True),
+        "href": anchor["href"],
+        "title": anchor.get_text(strip=True),
+        "date_text": date_cell.get_text(strip=True) if date_cell else None,
+        "date_title": date_cell.get("title") if date_cell else None,
+        "writer": writer,
+        "writer_ip": writer_ip,
+        "writer_uid": writer_uid,
+        "views_text": views_cell.get_text(strip=True) if views_cell else None,
+        "recommend_text": recommend_cell.get_text(strip=True) if recommend_cell else None,
+        "reply_text": reply_span.get_text(strip=True) if reply_span else None,
+    }
+
+
+def _read_list_row_fast(row) -> dict | None:
+    """
+    selectolax twin of `_read_list_row`; valueless attributes come back as None here.
+    """
+
+    attrs = row.attributes
+    if attrs.get("data-type") == "icon_notice":
+        return None
+    cells: dict = {}
+    for cell in row.iter():
+        if cell.tag == "td":
+            for class_name in (cell.attributes.get("class") or "").split():
+                cells.setdefault(class_name, cell)
+    number_cell = cells.get("gall_num")
+    title_cell = cells.get("gall_tit")
+    anchor = reply_box = None
+    for link in title_cell.css("a") if title_cell else ():
+        link_attrs = link.attributes
+        if anchor is None and "href" in link_attrs:
+            anchor = link
+        if reply_box is None and "reply_numbox" in (link_attrs.get("class") or "").split():
+            reply_box = link
+    if not number_cell or not anchor:
+        return None
+
+    date_cell = cells.get("gall_date")
+    writer_cell = cells.get("gall_writer")
+    writer = writer_ip = writer_uid = None
+    if writer_cell:
+        spans: dict = {}
+        for span in writer_cell.css("span"):
+            for class_name in (span.attributes.get("class") or "").split():
+                spans.setdefault(class_name, span)
+        writer = fast_parser.text(spans.get("nickname") or writer_cell)
+        writer_ip = fast_parser.text(spans.get("ip"))
+        writer_uid = writer_cell.attributes.get("data-uid") or writer_cell.attributes.get("user_id")
+
+    return {
+        "post_id": attrs.get("data-no") or fast_parser.text(number_cell),
+        "href": anchor.attributes.get("href") or "",
+        "title": fast_parser.text(anchor),
+        "date_text": fast_parser.text(date_cell),
+        "date_title": date_cell.attributes.get("title") if date_cell else None,
+        "writer": writer,
+        "writer_ip": writer_ip,
+        "writer_uid": writer_uid,
+        "views_text": fast_parser.text(cells.get("gall_count")),
+        "recommend_text": fast_parser.text(cells.get("gall_recommend")),
+        "reply_text": fast_parser.text(reply_box.css_first("span.reply_num") if reply_box else None),
+    }
+
+
 def _extract_int(value: str | None) -> int | None:
     if not value:
         return None
-    digits = "".join(ch for ch in value if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", value)
     return int(digits) if digits else None
@@ -4,16 +4,34 @@ Crawler for Instiz boards (e.g., 이슈카테고리).
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Sequence
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..base import BaseCrawler, CrawlResult
 from ..models import Comment, Post
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# List pages only need the post rows (`<tr id="list...">`).
+LIST_STRAINER = SoupStrainer("tr", id=lambda value: bool(value) and value.startswith("list"))
+
+# Selectors compiled once instead of per select() call.
+_SEL_ROWS = sv.compile("tr[id^='list']")
+_SEL_CONTENT = sv.compile("div.memo_content")
+_SEL_COMMENT_ROWS = sv.compile("#ajax_table tr")
+_SEL_COMMENT_AUTHOR = sv.compile(".href")
+_SEL_COMMENT_CONTENT = sv.compile(".comment_line span[id^='n']")
+_SEL_COMMENT_TIME = sv.compile(".comment_line .minitext")
+_SEL_TITLE = sv.compile("div.sbj")
+_SEL_VIEWS = sv.compile("div.listno")
+_SEL_COMMENT_COUNT = sv.compile("span.cmt")
+
 
 @dataclass
 class InstizBoardConfig:
@@ -49,34 +67,41 @@ class InstizCrawler(BaseCrawler):
         for offset in range(config.max_pages):
             page = config.start_page + offset
             url = f"{self.BASE_URL}/{config.board}?page={page}"
-            soup = self.get_soup(url)
-            rows = soup.select("tr[id^='list']")
+            soup = self.get_soup(url, parse_only=LIST_STRAINER)
+            rows = _SEL_ROWS.select(soup)
             if not rows:
                 break
 
+            tasks: list[dict] = []
+            view_counts: list[int | None] = []
+            queued_ids: set[str] = set()
             for row in rows:
                 link = row.find("a", href=True)
                 if not link:
                     continue
                 href = link["href"]
                 post_id = self._extract_post_id(href)
-                if not post_id or post_id in seen_ids:
+                if not post_id or post_id in seen_ids or post_id in queued_ids:
                     continue
 
-                title = self._extract_title(row)
-                view_count = self._extract_views(row)
-                list_comment_count = self._extract_comment_count(row)
-
-                post, post_comments = self._parse_post(
-                    board=config.board,
-                    href=href,
-                    post_id=post_id,
-                    fallback_title=title,
-                    fallback_comment_count=list_comment_count,
+                queued_ids.add(post_id)
+                view_counts.append(self._extract_views(row))
+                tasks.append(
+                    {
+                        "board": config.board,
+                        "href": href,
+                        "post_id": post_id,
+                        "fallback_title": self._extract_title(row),
+                        "fallback_comment_count": self._extract_comment_count(row),
+                    }
                 )
+
+            results = self.map_concurrent(self._parse_post, tasks)
+            for task, view_count, (post, post_comments) in zip(tasks, view_counts, results):
                 if not post:
                     continue
 
+                post_id = task["post_id"]
                 if view_count is not None:
                     post.meta["views"] = view_count
 
@@ -99,13 +124,14 @@ class InstizCrawler(BaseCrawler):
         detail_url = urljoin(self.BASE_URL, href)
         soup = self.get_soup(detail_url)
 
-        title = self._extract_meta(soup, property_name="og:title") or fallback_title or ""
-        content_node = soup.select_one("div.memo_content")
+        metas = self._extract_metas(soup)
+        title = metas.get("og:title") or fallback_title or ""
+        content_node = _SEL_CONTENT.select_one(soup)
         content = content_node.get_text("\n", strip=True) if content_node else ""
-        published = self._extract_meta(soup, property_name="article:published_time")
+        published = metas.get("article:published_time")
         posted_at = datetime.fromisoformat(published.replace("Z", "+00:00")) if published else None
 
-        image_url = self._extract_meta(soup, property_name="og:image")
+        image_url = metas.get("og:image")
         if image_url:
             content = f"{content}\n[이미지] {image_url}" if content else image_url
 
@@ -122,7 +148,7 @@ class InstizCrawler(BaseCrawler):
             meta={"board": board},
         )
 
-        comment_rows = soup.select("#ajax_table tr")
+        comment_rows = _SEL_COMMENT_ROWS.select(soup)
         parsed_comments: list[Comment] = []
         for idx, row in enumerate(comment_rows, start=1):
             comment = self._parse_comment_row(row, post_id, idx, board)
@@ -133,9 +159,9 @@ class InstizCrawler(BaseCrawler):
         return post, parsed_comments
 
     def _parse_comment_row(self, row: Tag, post_id: str, index: int, board: str) -> Comment | None:
-        author_node = row.select_one(".href")
-        content_node = row.select_one(".comment_line span[id^='n']")
-        time_node = row.select_one(".comment_line .minitext")
+        author_node = _SEL_COMMENT_AUTHOR.select_one(row)
+        content_node = _SEL_COMMENT_CONTENT.select_one(row)
+        time_node = _SEL_COMMENT_TIME.select_one(row)
         if not content_node:
             return None
 
@@ -174,35 +200,41 @@ class InstizCrawler(BaseCrawler):
 
     @staticmethod
     def _extract_title(row: Tag) -> str | None:
-        title_node = row.select_one("div.sbj")
+        title_node = _SEL_TITLE.select_one(row)
         if not title_node:
             return None
         return title_node.get_text(" ", strip=True)
 
     @staticmethod
     def _extract_views(row: Tag) -> int | None:
-        view_node = row.select_one("div.listno")
+        view_node = _SEL_VIEWS.select_one(row)
         if not view_node:
             return None
         text = view_node.get_text(" ", strip=True)
         marker = text.find("조회")
         if marker != -1:
-            digits = "".join(ch for ch in text[marker:] if ch.isdigit())
+            digits = _NON_DIGIT_RE.sub("", text[marker:])
             if digits:
                 return int(digits)
         return None
 
     @staticmethod
     def _extract_comment_count(row: Tag) -> int | None:
-        cmt = row.select_one("span.cmt")
+        cmt = _SEL_COMMENT_COUNT.select_one(row)
         if not cmt:
             return None
-        digits = "".join(ch for ch in cmt.get_text(strip=True) if ch.isdigit())
+        digits = _NON_DIGIT_RE.sub("", cmt.get_text(strip=True))
         return int(digits) if digits else None
 
     @staticmethod
-    def _extract_meta(soup: BeautifulSoup, *, property_name: str) -> str | None:
-        node = soup.select_one(f'meta[property="{property_name}"]')
-        if node:
-            return node.get("content")
-        return None
+    def _extract_metas(soup: BeautifulSoup) -> dict[str, str | None]:
+        """
+        Map every `<meta property=...>` to its content in one tree walk.
+
+        The first tag wins when a property repeats, like `select_one` did.
+        """
+
+        metas: dict[str, str | None] = {}
+        for node in soup.find_all("meta", attrs={"property": True}):
+            metas.setdefault(node["property"], node.get("content"))
+        return metas
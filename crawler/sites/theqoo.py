@@ -4,17 +4,82 @@ Simple crawler for TheQoo board listings (title + date).
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Sequence
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 from requests import RequestException
 
-from ..base import BaseCrawler, CrawlResult, progress_bar
+from ..base import BaseCrawler, CrawlResult, class_strainer, progress_bar
 from ..models import Post
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# List rows live in tables (`table.bd_lst`, or bare `td.title` rows on older skins).
+LIST_STRAINER = SoupStrainer("table")
+# The read view (header, body, author/date area) and comment list sit in these blocks.
+DETAIL_STRAINER = class_strainer("div", ["board", "rd", "rd_body", "theqoo_document_header", "fdb_lst"])
+_LIST_DATE_PATTERNS = ("%Y.%m.%d", "%y.%m.%d", "%m.%d", "%H:%M", "%m-%d")
+
+
+def _index_cells(row: Tag) -> dict[str, Tag]:
+    """
+    Map each class name to the first `<td>` of the row carrying it, in one pass over the cells.
+    """
+
+    cells: dict[str, Tag] = {}
+    for cell in row.find_all("td", recursive=False):
+        for class_name in cell.get("class") or ():
+            cells.setdefault(class_name, cell)
+    return cells
+
+
+def _list_date_format(text: str) -> str | None:
+    """Pick the strptime format for the common list/detail date cells from length and separators."""
+
+    n = len(text)
+    if n == 5:
+        if ":" in text:
+            return "%H:%M"
+        if "." in text:
+            return "%m.%d"
+        if "-" in text:
+            return "%m-%d"
+    elif n == 10 and text.count(".") == 2:
+        return "%Y.%m.%d"
+    elif n == 8 and text.count(".") == 2:
+        return "%y.%m.%d"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str, today: date) -> datetime | None:
+    """
+    Parse a list/detail date cell; list pages repeat the same few strings on every row.
+
+    The common cells are dispatched straight to their format so they cost a single
+    `strptime`; anything else (or a miss) falls back to trying every pattern. `today` is part of
+    the cache key because "%m.%d", "%m-%d" and "%H:%M" cells are relative to the current date.
+    """
+
+    fmt = _list_date_format(text)
+    patterns = (fmt, *_LIST_DATE_PATTERNS) if fmt else _LIST_DATE_PATTERNS
+    for fmt in patterns:
+        try:
+            dt = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if fmt == "%m.%d" or fmt == "%m-%d":
+            dt = dt.replace(year=today.year)
+        if fmt == "%H:%M":
+            dt = datetime(today.year, today.month, today.day, dt.hour, dt.minute)
+        return dt
+    return None
+
 
 @dataclass
 class TheQooBoardConfig:
@@ -52,11 +117,12 @@ class TheQooCrawler(BaseCrawler):
             range(config.start_page, config.start_page + config.max_pages),
             desc=f"[{label}] page",
             unit="page",
+            leave=False,
         )
 
         for page in page_iter:
             url = self._build_url(config.path, page)
-            soup = self.get_soup(url)
+            soup = self.get_soup(url, parse_only=LIST_STRAINER)
             row_nodes = soup.select("table.bd_lst tbody tr")
             if not row_nodes:
                 row_nodes = [
@@ -66,31 +132,39 @@ class TheQooCrawler(BaseCrawler):
                 ]
 
             stop_pagination = False
+            candidates: list[dict] = []
             for row in row_nodes:
                 if not row:
                     continue
                 if "notice" in row.get("class", []):
                     continue
-                title_anchor = row.select_one("td.title a[href]")
+                cells = _index_cells(row)
+                title_cell = cells.get("title")
+                # The title link and the comment-count link are both anchors in the title cell.
+                title_anchor = comment_link = None
+                for link in title_cell.find_all("a") if title_cell else ():
+                    if title_anchor is None and link.has_attr("href"):
+                        title_anchor = link
+                    if comment_link is None and "replyNum" in (link.get("class") or ()):
+                        comment_link = link
                 if not title_anchor:
                     continue
                 href = title_anchor["href"]
                 post_id = self._extract_post_id(href)
                 if not post_id or post_id in seen:
                     continue
-                number_cell = row.select_one("td.no")
+                number_cell = cells.get("no")
                 if number_cell:
                     strong = number_cell.find("strong")
                     if strong and "공지" in strong.get_text(strip=True):
                         continue
                 seen.add(post_id)
 
-                comment_link = row.select_one("td.title a.replyNum")
                 comment_count = self._extract_int(comment_link.get_text(strip=True)) if comment_link else 0
-                category_cell = row.select_one("td.cate")
+                category_cell = cells.get("cate")
                 category = category_cell.get_text(strip=True) if category_cell else None
-                date_cell = row.select_one("td.time")
-                views_cell = row.select_one("td.m_no")
+                date_cell = cells.get("time")
+                views_cell = cells.get("m_no")
                 posted_at = self._parse_list_date(date_cell)
 
                 if start_dt and posted_at and posted_at < start_dt:
@@ -101,9 +175,23 @@ class TheQooCrawler(BaseCrawler):
                 if (start_dt or end_dt) and posted_at is None:
                     continue
 
-                detail_data = self._fetch_detail(urljoin(self.BASE_URL, href))
+                candidates.append(
+                    {
+                        "post_id": post_id,
+                        "url": urljoin(self.BASE_URL, href),
+                        "list_title": title_anchor.get_text(strip=True),
+                        "comment_count": comment_count,
+                        "category": category,
+                        "views": self._extract_int(views_cell.get_text(strip=True)) if views_cell else None,
+                        "posted_at": posted_at,
+                    }
+                )
+
+            # Detail pages are fetched concurrently; results come back in list order.
+            details = self.map_concurrent(self._fetch_detail, [{"url": item["url"]} for item in candidates])
+            for item, detail_data in zip(candidates, details):
                 detail_posted_at = detail_data.get("posted_at") if detail_data else None
-                effective_date = detail_posted_at or posted_at
+                effective_date = detail_posted_at or item["posted_at"]
 
                 if start_dt and detail_posted_at and detail_posted_at < start_dt:
                     stop_pagination = True
@@ -121,17 +209,17 @@ class TheQooCrawler(BaseCrawler):
                     Post(
                         site=self.site_name,
                         gallery=label,
-                        source_id=post_id,
-                        url=urljoin(self.BASE_URL, href),
-                        title=detail_title or title_anchor.get_text(strip=True),
+                        source_id=item["post_id"],
+                        url=item["url"],
+                        title=detail_title or item["list_title"],
                         content=detail_content,
                         author=detail_author,
                         posted_at=effective_date,
-                        comment_count=detail_comment_count or comment_count,
+                        comment_count=detail_comment_count or item["comment_count"],
                         meta={
                             "board_path": config.path,
-                            "category": category,
-                            "views": self._extract_int(views_cell.get_text(strip=True)) if views_cell else None,
+                            "category": item["category"],
+                            "views": item["views"],
                             **detail_meta,
                         },
                     )
@@ -161,32 +249,13 @@ class TheQooCrawler(BaseCrawler):
     def _parse_list_date(node: Tag | None) -> datetime | None:
         if not node:
             return None
-        text = node.get_text(strip=True)
-        now = datetime.now()
-        patterns = [
-            "%Y.%m.%d",
-            "%y.%m.%d",
-            "%m.%d",
-            "%H:%M",
-            "%m-%d",
-        ]
-        for fmt in patterns:
-            try:
-                dt = datetime.strptime(text, fmt)
-                if fmt == "%m.%d" or fmt == "%m-%d":
-                    dt = dt.replace(year=now.year)
-                if fmt == "%H:%M":
-                    dt = now.replace(hour=dt.hour, minute=dt.minute, second=0, microsecond=0)
-                return dt
-            except ValueError:
-                continue
-        return None
+        return _parse_date_text(node.get_text(strip=True), date.today())
 
     @staticmethod
     def _extract_int(value: str | None) -> int | None:
         if not value:
             return None
-        digits = "".join(ch for ch in value if ch.isdigit())
+        digits = _NON_DIGIT_RE.sub("", value)
         return int(digits) if digits else None
 
     @staticmethod
@@ -206,7 +275,7 @@ class TheQooCrawler(BaseCrawler):
 
     def _fetch_detail(self, url: str) -> dict | None:
         try:
-            soup = self.get_soup(url)
+            soup = self.get_soup(url, parse_only=DETAIL_STRAINER)
         except RequestException:
             return None
 
@@ -243,5 +312,5 @@ class TheQooCrawler(BaseCrawler):
         header = soup.select_one(".fdb_lst .comment_header_bar")
         if not header:
             return None
-        digits = "".join(ch for ch in header.get_text(strip=True) if ch.isdigit())
+        digits = _NON_DIGIT_RE.sub("", header.get_text(strip=True))
         return int(digits) if digits else None
@@ -4,8 +4,10 @@ Persistence helpers for saving crawled data as JSON/CSV.
 
 from __future__ import annotations
 
+import codecs
 import json
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Sequence
 
@@ -14,6 +16,18 @@ import pandas as pd
 from .config import PROCESSED_DIR, RAW_DIR, ensure_data_dirs
 from .models import Comment, Post
 
+try:  # orjson serializes the slotted dataclasses and datetimes natively
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pyarrow writes CSV from native code instead of pandas' Python row writer
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_csv = None
+
 
 def _prepare_records(records: Iterable[Post | Comment]) -> list[dict]:
     serialized = []
@@ -27,6 +41,7 @@ def _prepare_records(records: Iterable[Post | Comment]) -> list[dict]:
     return serialized
 
 
+@lru_cache(maxsize=1024)
 def _slugify(value: str | None) -> str:
     if not value:
         return ""
@@ -35,6 +50,7 @@ def _slugify(value: str | None) -> str:
     return sanitized.strip("_") or ""
 
 
+@lru_cache(maxsize=1024)  # exports repeat a handful of (site, gallery) pairs per record
 def _source_prefix(site: str | None, gallery: str | None) -> str:
     site_slug = _slugify(site) or "data"
     gallery_slug = _slugify(gallery)
@@ -45,16 +61,78 @@ def save_json(records: Iterable[Post | Comment | dict], filename: str) -> Path:
     ensure_data_dirs()
     path = RAW_DIR / filename
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(_prepare_records(records), option=orjson.OPT_INDENT_2))
+        return path
     with path.open("w", encoding="utf-8") as f:
         json.dump(_prepare_records(records), f, ensure_ascii=False, indent=2)
     return path
 
 
+def save_ndjson(records: Iterable[Post | Comment | dict], filename: str) -> Path:
+    """
+    Stream one JSON object per line instead of building the whole list in memory.
+    """
+
+    ensure_data_dirs()
+    path = RAW_DIR / filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with path.open("wb") as f:
+            for item in records:
+                if not isinstance(item, (Post, Comment, dict)):
+                    (item,) = _prepare_records([item])
+                f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
+        return path
+    with path.open("w", encoding="utf-8") as f:
+        for record in _prepare_records(records):
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    return path
+
+
+def _records_to_table(records: list[dict]):
+    """
+    Build an Arrow table with the same columns pandas would infer, or None if Arrow can't.
+
+    Nested values (meta, comments) are written as their Python repr, as pandas does.
+    """
+
+    if pa is None or not records:
+        return None
+    keys = dict.fromkeys(key for record in records for key in record)
+    columns = {}
+    for key in keys:
+        values = [record.get(key) for record in records]
+        if any(isinstance(value, (dict, list)) for value in values):
+            values = [None if value is None else str(value) for value in values]
+        columns[key] = values
+    try:
+        return pa.table(columns)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):  # e.g. a column mixing ints and strings
+        return None
+
+
 def save_csv(records: Iterable[Post | Comment | dict], filename: str) -> Path:
+    """
+    Write records as a utf-8-sig CSV, through pyarrow when it can type the columns.
+
+    Post content keeps its line breaks inside quoted fields. Arrow-based readers
+    must enable ``ParseOptions(newlines_in_values=True)`` to read these files;
+    ``pd.read_csv(engine="pyarrow")`` cannot, and fails on them.
+    """
+
     ensure_data_dirs()
     path = RAW_DIR / filename
     path.parent.mkdir(parents=True, exist_ok=True)
-    frame = pd.DataFrame(_prepare_records(records))
+    prepared = _prepare_records(records)
+    table = _records_to_table(prepared)
+    if table is not None:
+        with path.open("wb") as f:
+            f.write(codecs.BOM_UTF8)  # keep utf-8-sig so Excel detects the encoding
+            pa_csv.write_csv(table, f)
+        return path
+    frame = pd.DataFrame(prepared)
     frame.to_csv(path, index=False, encoding="utf-8-sig")
     return path
 
@@ -64,19 +142,24 @@ def export_dataset(
     posts: Sequence[Post] | None = None,
     comments: Sequence[Comment] | None = None,
     prefix: str,
+    ndjson: bool = False,
 ) -> dict[str, Path]:
     """
     Save posts/comments in CSV format while returning the paths.
-    JSON 저장은 제거됨 (CSV만 저장)
+    JSON 저장은 제거됨 (CSV만 저장) - `ndjson=True`면 JSON Lines도 함께 저장
     """
 
     results: dict[str, Path] = {}
 
     if posts:
         results["posts_csv"] = save_csv(posts, f"{prefix}_posts.csv")
+        if ndjson:
+            results["posts_jsonl"] = save_ndjson(posts, f"{prefix}_posts.jsonl")
 
     if comments:
         results["comments_csv"] = save_csv(comments, f"{prefix}_comments.csv")
+        if ndjson:
+            results["comments_jsonl"] = save_ndjson(comments, f"{prefix}_comments.jsonl")
 
     return results
 
@@ -94,10 +177,11 @@ def export_by_source(
     *,
     posts: Sequence[Post] | None = None,
     comments: Sequence[Comment] | None = None,
+    ndjson: bool = False,
 ) -> dict[str, dict[str, Path]]:
     """
     Save datasets grouped by site/gallery so filenames follow `site_gallery_*`.
-    JSON 저장은 제거됨 (CSV만 저장)
+    JSON 저장은 제거됨 (CSV만 저장) - `ndjson=True`면 JSON Lines도 함께 저장
     """
 
     results: dict[str, dict[str, Path]] = {}
@@ -114,9 +198,13 @@ def export_by_source(
     for key, grouped_posts in posts_by.items():
         bucket = results.setdefault(key, {})
         bucket["posts_csv"] = save_csv(grouped_posts, f"{key}_posts.csv")
+        if ndjson:
+            bucket["posts_jsonl"] = save_ndjson(grouped_posts, f"{key}_posts.jsonl")
 
     for key, grouped_comments in comments_by.items():
         bucket = results.setdefault(key, {})
         bucket["comments_csv"] = save_csv(grouped_comments, f"{key}_comments.csv")
+        if ndjson:
+            bucket["comments_jsonl"] = save_ndjson(grouped_comments, f"{key}_comments.jsonl")
 
     return results
@@ -4,27 +4,124 @@
 - 중복 제거
 - 정제된 데이터를 data/preprocessed/ 저장
 """
+import numpy as np
 import pandas as pd
 import os
 import re
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from utils.csv_utils import read_csv
+
+# "- dc official App"과 영어 알파벳을 한 번에 제거 (대소문자 무시는 앞쪽 문구에만 적용)
+# 공백 정리는 제거 후에 생긴 공백까지 합쳐야 하므로 별도 패스로 유지
+# (str.split()은 re의 \s와 같은 유니코드 공백 기준이라 정규식 없이 처리)
+_STRIP_RE = re.compile(r'(?i:-\s*dc\s+official\s+App)|[a-zA-Z]+')
+
 def clean_text(text):
     """텍스트에서 영어와 특정 문자열 제거"""
     if not isinstance(text, str):
         return text
     
-    # "- dc official App" 제거
-    text = re.sub(r'-\s*dc\s+official\s+App', '', text, flags=re.IGNORECASE)
-    
-    # 영어 알파벳 제거 (한글, 숫자, 특수문자는 유지)
+    # "- dc official App" 및 영어 알파벳 제거 (한글, 숫자, 특수문자는 유지)
     # 단, URL이나 이메일은 이미 제거되었다고 가정
-    text = re.sub(r'[a-zA-Z]+', '', text)
-    
-    # 연속된 공백을 하나로
-    text = re.sub(r'\s+', ' ', text)
+    text = _STRIP_RE.sub('', text)
     
-    return text.strip()
+    # 연속된 공백을 하나로 (앞뒤 공백 제거 포함)
+    return ' '.join(text.split())
+
+def clean_series(series):
+    """clean_text의 컬럼 단위 버전 (문자열이 아닌 값은 그대로 유지)"""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return series
+    cleaned = (
+        series.str.replace(_STRIP_RE, '', regex=True)
+        .str.split()
+        .str.join(' ')
+    )
+    # .str 메서드는 문자열이 아닌 값을 NaN으로 바꾸므로 원래 값으로 되돌림
+    return cleaned.where(cleaned.notna() | series.isna(), series)
+
+def duplicated_text(texts):
+    """
+    texts.duplicated(keep='first')와 같은 결과를 64비트 해시로 먼저 걸러서 계산
+    (해시가 겹치는 행만 원문 비교하므로 충돌이 있어도 결과는 동일)
+    """
+    hashes = pd.util.hash_pandas_object(texts, index=False)
+    candidates = hashes.duplicated(keep=False).to_numpy()
+    duplicated = np.zeros(len(texts), dtype=bool)
+    duplicated[candidates] = texts[candidates].duplicated(keep='first').to_numpy()
+    return pd.Series(duplicated, index=texts.index)
+
+def parse_posted_at(raw):
+    """
+    posted_at 문자열을 한 번에 파싱하여 (값 Series, 파싱 실패 개수)를 반환 (같은 문자열은 캐시 재사용)
+    - 시간대 없는 값은 datetime64로 바꾸고, 파싱하지 못한 값은 원문 문자열을 그대로 둠
+    - UTC 오프셋이 있는 값이 섞여 있으면 원문 문자열을 그대로 유지
+      (pandas는 오프셋이 다르면 object로, 시간대 없는 값이 섞이면 한 시간대로 맞춰 버림)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)  # 오프셋이 섞인 경우의 경고 (그 결과는 쓰지 않음)
+        parsed = pd.to_datetime(raw, format='ISO8601', cache=True, errors='coerce')
+    unparsed = parsed.isna() & raw.notna()
+    if not pd.api.types.is_datetime64_dtype(parsed) or isinstance(parsed.dtype, pd.DatetimeTZDtype):
+        return raw, int(unparsed.sum())
+    if unparsed.any():
+        parsed = parsed.astype(object).where(~unparsed, raw)
+    return parsed, int(unparsed.sum())
+
+def format_posted_at(values):
+    """
+    posted_at의 datetime 값을 크롤러와 같은 ISO 문자열로 변환 ('T' 구분, 마이크로초가 있으면 유지)
+    원문 그대로 둔 문자열과 결측값은 바꾸지 않음
+    """
+    return values.map(lambda value: value.isoformat() if isinstance(value, pd.Timestamp) else value)
+
+def process_file(file_path):
+    """CSV 파일 하나를 정제하여 (DataFrame 또는 None, 로그 목록)을 반환"""
+    logs = []
+    try:
+        df = read_csv(file_path)
+        logs.append(f"  - 로드된 행 수: {len(df)}")
+        
+        # posted_at은 한 번에 파싱 (같은 문자열은 캐시 재사용)
+        if 'posted_at' in df.columns:
+            df['posted_at'], unparsed = parse_posted_at(df['posted_at'])
+            if unparsed:
+                logs.append(f"  - ⚠️  posted_at 파싱 실패 {unparsed}개 (원문 그대로 저장됨)")
+        
+        # site와 gallery 컬럼으로 community 생성
+        if 'site' in df.columns and 'gallery' in df.columns:
+            df['community'] = df['site'] + '_' + df['gallery']
+        
+        # title과 content 정제
+        if 'title' in df.columns:
+            df['title'] = clean_series(df['title'])
+        
+        if 'content' in df.columns:
+            df['content'] = df['content'].fillna('')
+            df['content'] = clean_series(df['content'])
+        
+        # full_text 생성 (정제된 title + content)
+        df['full_text'] = df['title'].astype(str) + " " + df['content'].astype(str)
+        df['full_text'] = df['full_text'].str.strip()
+        
+        # 필요한 컬럼만 선택
+        columns_to_keep = ['community', 'title', 'content', 'full_text', 'posted_at']
+        available_columns = [col for col in columns_to_keep if col in df.columns]
+        df = df[available_columns]
+        
+        logs.append(f"  - 정제 완료")
+        return df, logs
+        
+    except Exception as e:
+        logs.append(f"  - 오류 발생: {e}")
+        return None, logs
 
 def main():
     print("=" * 60)
@@ -47,40 +144,17 @@ def main():
     
     all_dfs = []
     
-    # 각 파일 처리
-    for file_path in csv_files:
+    # 각 파일 처리 (파일끼리 독립적이므로 프로세스 병렬 처리, 로그는 파일 순서대로 출력)
+    max_workers = min(len(csv_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(process_file, csv_files))
+    
+    for file_path, (df, logs) in zip(csv_files, results):
         print(f"\n처리 중: {file_path.name}")
-        try:
-            df = pd.read_csv(file_path)
-            print(f"  - 로드된 행 수: {len(df)}")
-            
-            # site와 gallery 컬럼으로 community 생성
-            if 'site' in df.columns and 'gallery' in df.columns:
-                df['community'] = df['site'] + '_' + df['gallery']
-            
-            # title과 content 정제
-            if 'title' in df.columns:
-                df['title'] = df['title'].apply(clean_text)
-            
-            if 'content' in df.columns:
-                df['content'] = df['content'].fillna('')
-                df['content'] = df['content'].apply(clean_text)
-            
-            # full_text 생성 (정제된 title + content)
-            df['full_text'] = df['title'].astype(str) + " " + df['content'].astype(str)
-            df['full_text'] = df['full_text'].str.strip()
-            
-            # 필요한 컬럼만 선택
-            columns_to_keep = ['community', 'title', 'content', 'full_text', 'posted_at']
-            available_columns = [col for col in columns_to_keep if col in df.columns]
-            df = df[available_columns]
-            
+        for line in logs:
+            print(line)
+        if df is not None:
             all_dfs.append(df)
-            print(f"  - 정제 완료")
-            
-        except Exception as e:
-            print(f"  - 오류 발생: {e}")
-            continue
     
     if not all_dfs:
         print("\n오류: 처리된 데이터가 없습니다.")
@@ -94,7 +168,7 @@ def main():
     
     # 중복 제거 (전체 기준)
     initial_count = len(full_df)
-    full_df = full_df.drop_duplicates(subset=['full_text'], keep='first')
+    full_df = full_df[~duplicated_text(full_df['full_text'])]
     removed_count = initial_count - len(full_df)
     print(f"제거된 중복 행: {removed_count}개")
     
@@ -109,6 +183,10 @@ def main():
     print("\n" + "=" * 60)
     print("커뮤니티별 저장 중...")
     
+    # posted_at은 저장 직전에 ISO 문자열로 (파일마다 datetime/원문 문자열이 섞여 있을 수 있음)
+    if 'posted_at' in full_df.columns:
+        full_df = full_df.assign(posted_at=format_posted_at(full_df['posted_at']))
+    
     communities = full_df['community'].unique()
     for community in communities:
         community_df = full_df[full_df['community'] == community]
@@ -9,8 +9,11 @@ Input: data/preprocessed/all_communities_cleaned.csv
 Output: data/processed/all_communities_tagged.csv
 """
 
-import json
+import csv
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 import pandas as pd
@@ -21,13 +24,25 @@ sys.path.insert(0, str(project_root))
 
 from utils.bareun_analyzer import BareunAnalyzer
 from utils.morph_analyzer import MorphAnalyzer
+from utils.json_utils import json_dumps
 
 
 import argparse
 
+OUTPUT_COLUMNS = ['community', 'title', 'content', 'full_text', 'posted_at', 'sentence_segments']
+
+
+def csv_value(value):
+    """pandas.to_csv와 같게 결측값(None/NaN)은 빈 칸으로 기록"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(description="Bareun 형태소 분석 태깅 스크립트")
     parser.add_argument("--gallery", type=str, help="특정 갤러리/커뮤니티만 처리 (파일명에 포함된 문자열)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시에 보낼 Bareun API 요청 수 (1이면 순차 처리)")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -54,6 +69,7 @@ def main():
     print(f"발견된 파일: {len(input_files)}개")
     
     analyzer = BareunAnalyzer()
+    analyze = cached_analyze(analyzer)
     splitter = MorphAnalyzer()
 
     for input_path in input_files:
@@ -65,38 +81,12 @@ def main():
         output_path = output_dir / output_filename
         
         df = pd.read_csv(input_path)
-        tagged_rows = []
         
-        for _, row in tqdm(df.iterrows(), total=len(df), desc=f"{community_name} 태깅"):
-            full_text = str(row.get('full_text', '') or '')
-            sentences = splitter.split_sentences(full_text)
-    
-            sentence_segments = []
-            if sentences:
-                for sentence in sentences:
-                    tokens = analyzer.analyze(sentence)
-                    sentence_segments.append({
-                        'sentence': sentence,
-                        'tokens': [list(token) for token in tokens]
-                    })
-            elif full_text:
-                tokens = analyzer.analyze(full_text)
-                sentence_segments.append({
-                    'sentence': full_text,
-                    'tokens': [list(token) for token in tokens]
-                })
-    
-            tagged_rows.append({
-                'community': row.get('community', ''),
-                'title': row.get('title', ''),
-                'content': row.get('content', ''),
-                'full_text': full_text,
-                'posted_at': row.get('posted_at', row.get('timestamp', '')),
-                'sentence_segments': json.dumps(sentence_segments, ensure_ascii=False)
-            })
-    
-        tagged_df = pd.DataFrame(tagged_rows)
-        tagged_df.to_csv(output_path, index=False, encoding='utf-8')
+        # 태깅 결과를 리스트/DataFrame에 모으지 않고 한 행씩 바로 기록
+        with output_path.open('w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS, lineterminator='\n')
+            writer.writeheader()
+            tag_rows(df, community_name, analyze, splitter, writer, args.concurrency)
         print(f"  -> 저장 완료: {output_path}")
 
     print("\n" + "=" * 60)
@@ -104,5 +94,83 @@ def main():
     print("=" * 60)
 
 
+def cached_analyze(analyzer, maxsize=1 << 17):
+    """
+    analyzer.analyze를 문장 문자열 기준으로 캐시한 함수를 반환
+    (커뮤니티 글은 같은 짧은 문장이 반복되므로 중복 API 호출을 생략)
+    """
+    @lru_cache(maxsize=maxsize)
+    def analyze(sentence):
+        return tuple(analyzer.analyze(sentence))
+    return analyze
+
+
+def tag_row(row, analyze, splitter):
+    """한 행을 문장 단위로 태깅하여 출력 행(dict)을 반환"""
+    full_text = str(row.get('full_text', '') or '')
+    sentences = splitter.split_sentences(full_text)
+
+    sentence_segments = []
+    if sentences:
+        for sentence in sentences:
+            tokens = analyze(sentence)
+            sentence_segments.append({
+                'sentence': sentence,
+                'tokens': [list(token) for token in tokens]
+            })
+    elif full_text:
+        tokens = analyze(full_text)
+        sentence_segments.append({
+            'sentence': full_text,
+            'tokens': [list(token) for token in tokens]
+        })
+
+    return {
+        'community': csv_value(row.get('community', '')),
+        'title': csv_value(row.get('title', '')),
+        'content': csv_value(row.get('content', '')),
+        'full_text': full_text,
+        'posted_at': csv_value(row.get('posted_at', row.get('timestamp', ''))),
+        'sentence_segments': json_dumps(sentence_segments)
+    }
+
+
+def tag_rows(df, community_name, analyze, splitter, writer, concurrency=1):
+    """
+    DataFrame의 각 행을 태깅하여 writer에 기록
+    Bareun 호출은 네트워크 대기 시간이 대부분이라 concurrency개의 스레드로 겹쳐서 보내고,
+    결과는 입력 순서대로 기록합니다.
+    """
+    # iterrows()처럼 행마다 Series를 만들지 않고 튜플을 dict로만 묶음 (row.get 그대로 사용)
+    columns = list(df.columns)
+    rows = (dict(zip(columns, values)) for values in df.itertuples(index=False, name=None))
+    # 캐시 적중 시 행 처리가 빨라 매 행마다 화면을 다시 그리지 않도록 갱신 간격을 둠
+    progress = tqdm(
+        total=len(df),
+        desc=f"{community_name} 태깅",
+        mininterval=0.5,
+        miniters=max(1, len(df) // 1000),
+        smoothing=0.3,
+    )
+    if concurrency <= 1:
+        for row in rows:
+            writer.writerow(tag_row(row, analyze, splitter))
+            progress.update()
+        progress.close()
+        return
+
+    # 한 번에 제출하는 행 수를 제한해 결과가 메모리에 쌓이지 않도록 함
+    window = concurrency * 4
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            batch = list(islice(rows, window))
+            if not batch:
+                break
+            for tagged in executor.map(lambda row: tag_row(row, analyze, splitter), batch):
+                writer.writerow(tagged)
+                progress.update()
+    progress.close()
+
+
 if __name__ == "__main__":
     main()
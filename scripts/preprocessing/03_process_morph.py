@@ -10,8 +10,14 @@ Input: data/processed/all_communities_tagged.csv
 Output: data/processed/all_communities_morph.csv
 """
 
+import csv
+import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
 from pathlib import Path
 
 import pandas as pd
@@ -21,13 +27,26 @@ project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
 
 from utils.morph_analyzer import MorphAnalyzer
+from utils.json_utils import json_loads, json_dumps
 
 
 import argparse
 import sys
 
+
+def csv_value(value):
+    """pandas.to_csv와 같게 결측값(None/NaN)은 빈 칸으로 기록"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return value
+
+
+# 입력 CSV를 한 번에 읽을 행 수 (파일 전체를 메모리에 올리지 않음)
+CHUNK_SIZE = 10_000
+
 # Interactive decision cache
-# Key: (morph, tag), Value: 'EF' (change) or 'KEEP' (keep) or 'SKIP' (skip all)
+# decision_cache[tag][morph] = 'EF' (change) or 'KEEP' (keep) or 'SKIP' (skip all)
+# (tag -> morph 2단 dict로 두어 토큰마다 (morph, tag) 튜플 키를 만들지 않음)
 decision_cache = {}
 stats = {'corrections': 0}
 
@@ -36,10 +55,10 @@ def interactive_callback(token, context_tokens, index, sentence=None):
     MorphAnalyzer에서 호출하는 대화형 콜백 함수
     """
     morph, tag, prob = token[0], token[1], token[2]
-    cache_key = (morph, tag)
+    decisions = decision_cache.get(tag)
+    decision = decisions.get(morph) if decisions is not None else None
     
-    if cache_key in decision_cache:
-        decision = decision_cache[cache_key]
+    if decision is not None:
         if decision == 'KEEP':
             return None
         elif decision == 'SKIP':
@@ -84,13 +103,13 @@ def interactive_callback(token, context_tokens, index, sentence=None):
         if choice == 'e':
             new_tag = 'EF'
             if apply_all:
-                decision_cache[cache_key] = new_tag
+                decision_cache.setdefault(tag, {})[morph] = new_tag
             stats['corrections'] += 1
             return new_tag
             
         elif choice == 'k':
             if apply_all:
-                decision_cache[cache_key] = 'KEEP'
+                decision_cache.setdefault(tag, {})[morph] = 'KEEP'
             return None
             
         elif choice == 'd':
@@ -99,7 +118,7 @@ def interactive_callback(token, context_tokens, index, sentence=None):
             return 'DELETE'
             
         elif choice == 's':
-            decision_cache[cache_key] = 'SKIP'
+            decision_cache.setdefault(tag, {})[morph] = 'SKIP'
             return None
             
         elif choice == 'c':
@@ -108,139 +127,170 @@ def interactive_callback(token, context_tokens, index, sentence=None):
                 print("Invalid tag.")
                 continue
             if apply_all:
-                decision_cache[cache_key] = new_tag
+                decision_cache.setdefault(tag, {})[morph] = new_tag
             stats['corrections'] += 1
             return new_tag
             
         else:
             print("Invalid choice.")
 
-def main():
-    parser = argparse.ArgumentParser(description="Morph 후처리 스크립트")
-    parser.add_argument("--interactive", action="store_true", help="대화형 모드로 실행하여 애매한 태그를 직접 확인합니다.")
-    parser.add_argument("--gallery", type=str, help="특정 갤러리/커뮤니티만 처리 (파일명에 포함된 문자열)")
-    args = parser.parse_args()
+def piece_stats(piece_tokens):
+    """
+    토큰 리스트에서 (min_prob, last_token_prob, has_oov)를 계산
+    조각 하나의 토큰 수가 적어 NumPy 배열로 바꾸는 비용이 더 크므로 한 번의 순회로 함께 구함
+    """
+    min_prob = None
+    has_oov = False
+    for t in piece_tokens:
+        n = len(t)
+        if n >= 3:
+            prob = t[2]
+            if min_prob is None or prob < min_prob:
+                min_prob = prob
+            if n >= 4 and t[3] > 0:
+                has_oov = True
+    if min_prob is None:
+        min_prob = 0.0
+    last_token_prob = piece_tokens[-1][2] if piece_tokens and len(piece_tokens[-1]) >= 3 else 0.0
+    return min_prob, last_token_prob, has_oov
 
-    print("=" * 60)
-    print("Morph 후처리 시작")
-    if args.interactive:
-        print("📢 대화형 모드 활성화: 확률 0.92 이하인 EC 태그에 대해 확인을 요청합니다.")
-    if args.gallery:
-        print(f"필터 적용: '{args.gallery}'")
-    print("=" * 60)
 
-    input_dir = Path("data/processed/tagged")
-    output_dir = Path("data/processed/morph")
-    output_dir.mkdir(parents=True, exist_ok=True)
+def iter_unique_rows(input_path, start_idx=0, counts=None):
+    """
+    CSV를 CHUNK_SIZE 행씩 읽으며 (index, 행 dict)를 순서대로 생성
+    'content'(없으면 'sentence') 기준 중복 행은 첫 행만 남기고 (drop_duplicates와 같음),
+    중복 제거 후 앞의 start_idx개 행(이미 처리한 행)은 건너뜁니다.
+    다 읽고 나면 counts에 중복 제거 후 행 수('total')와 제거된 행 수('duplicates')를 기록
+    """
+    if counts is None:
+        counts = {}
+    seen = set()
+    total = 0
+    duplicates = 0
+    # 청크마다 dtype을 따로 추론하지 않도록 문자열로 읽음 (결측값은 NaN 그대로)
+    for chunk in pd.read_csv(input_path, chunksize=CHUNK_SIZE, dtype=str):
+        columns = list(chunk.columns)
+        target_col = 'content' if 'content' in columns else 'sentence'
+        counts['target_col'] = target_col
+        target_pos = columns.index(target_col) if target_col in columns else None
+        for idx, values in zip(chunk.index, chunk.itertuples(index=False, name=None)):
+            if target_pos is not None:
+                key = values[target_pos]
+                if not isinstance(key, str):
+                    key = None  # 결측값끼리는 같은 값으로 취급
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+            total += 1
+            if total <= start_idx:
+                continue
+            # iterrows()처럼 행마다 Series를 만들지 않고 튜플을 dict로만 묶음 (row.get 그대로 사용)
+            yield idx, dict(zip(columns, values))
+    counts['total'] = total
+    counts['duplicates'] = duplicates
+
+
+def process_file(input_path, output_dir, interactive=False):
+    """
+    tagged CSV 파일 하나를 Morph 후처리하여 output_dir에 저장
+    (.partial.csv로 중간 저장하며, 이전 작업이 있으면 이어서 처리)
+    """
+    analyzer = MorphAnalyzer()
+    print(f"\n처리 중: {input_path.name}")
     
-    all_files = list(input_dir.glob("tagged_*.csv"))
-    if args.gallery:
-        input_files = [f for f in all_files if args.gallery in f.name]
-    else:
-        input_files = all_files
+    community_name = input_path.stem.replace("tagged_", "")
+    output_filename = f"morph_{community_name}.csv"
+    output_path = output_dir / output_filename
     
-    if not input_files:
-        print(f"\n❌ 오류: 처리할 파일이 없습니다. (필터: {args.gallery})")
-        return
+    processed_rows = []
+    
+    # Use callback only if interactive mode is on
+    callback = interactive_callback if interactive else None
+    
+    # Incremental saving setup
+    save_interval = 100
+    output_path_partial = output_path.with_suffix('.partial.csv')
+    
+    # If resuming (partial file exists), count processed rows (청크 단위로 세어 파일 전체를 올리지 않음)
+    start_idx = 0
+    if output_path_partial.exists():
+        try:
+            start_idx = sum(len(chunk) for chunk in pd.read_csv(output_path_partial, chunksize=CHUNK_SIZE))
+            print(f"  🔄 이전 작업 발견: {start_idx}개 행 처리됨. 이어서 작업을 시작합니다.")
+        except Exception as e:
+            print(f"  ⚠️ 부분 파일 읽기 실패 (새로 시작): {e}")
+    
+    # 입력은 CHUNK_SIZE 행씩 읽으며 중복 제거 및 이미 처리한 행 건너뛰기 (iter_unique_rows)
+    columns = list(pd.read_csv(input_path, nrows=0).columns)
+    counts = {}
 
-    print(f"발견된 파일: {len(input_files)}개")
-    analyzer = MorphAnalyzer()
+    # 부분 파일은 처음 쓸 때 한 번만 열고 csv.writer로 이어 씀 (배치마다 DataFrame을 만들지 않음)
+    output_columns = columns + ['morph_results']
+    partial_file = None
+    partial_writer = None
 
-    for input_path in input_files:
-        print(f"\n처리 중: {input_path.name}")
-        
-        community_name = input_path.stem.replace("tagged_", "")
-        output_filename = f"morph_{community_name}.csv"
-        output_path = output_dir / output_filename
-        
-        df = pd.read_csv(input_path)
-        
-        # Deduplication: Remove rows with duplicate 'sentence' (if exists) or 'content'
-        # Check available columns
-        target_col = 'content' if 'content' in df.columns else 'sentence'
-        if target_col in df.columns:
-            initial_len = len(df)
-            df.drop_duplicates(subset=[target_col], inplace=True)
-            removed_len = initial_len - len(df)
-            if removed_len > 0:
-                print(f"  - 중복 제거됨: {removed_len}개 행 (기준: {target_col})")
-        
-        processed_rows = []
-        
-        # Use callback only if interactive mode is on
-        callback = interactive_callback if args.interactive else None
-        
-        # Incremental saving setup
-        save_interval = 100
-        output_path_partial = output_path.with_suffix('.partial.csv')
-        
-        # If resuming (partial file exists), load it to count processed rows
-        start_idx = 0
-        if output_path_partial.exists():
-            try:
-                partial_df = pd.read_csv(output_path_partial)
-                start_idx = len(partial_df)
-                print(f"  🔄 이전 작업 발견: {start_idx}개 행 처리됨. 이어서 작업을 시작합니다.")
-            except Exception as e:
-                print(f"  ⚠️ 부분 파일 읽기 실패 (새로 시작): {e}")
-        
-        # Slice df to skip processed rows
-        if start_idx > 0:
-            if start_idx >= len(df):
-                print("  ✅ 모든 데이터가 이미 처리되었습니다.")
-                # Rename partial to final if needed?
-                # If final doesn't exist but partial does and is complete.
-                if not output_path.exists():
-                    output_path_partial.replace(output_path)
-                    print(f"  -> 저장 완료: {output_path}")
-                continue
-            
-            df = df.iloc[start_idx:]
-            print(f"  -> 남은 {len(df)}개 행을 처리합니다.")
+    def write_partial(rows):
+        nonlocal partial_file, partial_writer
+        if partial_writer is None:
+            header = not output_path_partial.exists()
+            partial_file = open(output_path_partial, 'a', newline='', encoding='utf-8-sig')
+            partial_writer = csv.writer(partial_file, lineterminator='\n')
+            if header:
+                partial_writer.writerow(output_columns)
+        partial_writer.writerows([csv_value(row.get(col)) for col in output_columns] for row in rows)
+        partial_file.flush()  # 중단되어도 이어서 작업할 수 있도록 배치마다 디스크에 반영
 
-        for idx, row in tqdm(df.iterrows(), total=len(df), desc=f"{community_name} Morph"):
+    # 같은 sentence_segments(재게시 글 등)는 한 번만 분석하도록 원문 셀 -> morph_results JSON 캐시
+    # 대화형 모드는 행마다 사용자 결정이 달라질 수 있어 캐시하지 않음
+    seg_cache = {} if callback is None else None
+
+    rows = iter_unique_rows(input_path, start_idx, counts)
+    for idx, row in tqdm(rows, desc=f"{community_name} Morph"):
+        raw_segments = row.get('sentence_segments', '[]') or '[]'
+        cached = seg_cache.get(raw_segments) if seg_cache is not None else None
+        if cached is not None:
+            row['morph_results'] = cached
+        else:
             segments = []
             try:
-                segments = json.loads(row.get('sentence_segments', '[]') or '[]')
+                segments = json_loads(raw_segments)
             except json.JSONDecodeError:
                 segments = []
-    
+
             morph_results = []
             skip_row = False
-            
+            had_error = False
+        
             for segment in segments:
                 base_sentence = segment.get('sentence', '')
                 tokens = segment.get('tokens', [])
-                
+            
                 # Pass callback to segment_sentence_by_endings
                 try:
                     segmented = analyzer.segment_sentence_by_endings(base_sentence, tokens, refinement_callback=callback)
                 except Exception as e:
                     print(f"Error processing row {idx}: {e}")
+                    had_error = True
                     continue
-                    
+                
                 for piece_text, piece_tokens in segmented:
                     # Check for DELETE signal
                     if any(t[1] == 'DELETE' for t in piece_tokens):
                         skip_row = True
                         break
-                        
+                    
                     ending_tokens = analyzer.extract_final_endings(piece_tokens)
                     punctuation, other_symbols = analyzer.extract_symbols(piece_text)
-    
-                    # Calculate min probability
-                    probs = [t[2] for t in piece_tokens if len(t) >= 3]
-                    min_prob = min(probs) if probs else 0.0
-                    last_token_prob = piece_tokens[-1][2] if piece_tokens and len(piece_tokens[-1]) >= 3 else 0.0
-                    
-                    # Check for OOV
-                    has_oov = any(len(t) >= 4 and t[3] > 0 for t in piece_tokens)
-                    
+
+                    # Calculate min probability / last token probability / OOV
+                    min_prob, last_token_prob, has_oov = piece_stats(piece_tokens)
+                
                     # Manual intent check logic (simplified)
                     needs_manual_intent = False
                     if min_prob < 0.95 or has_oov:
                         needs_manual_intent = True
-    
+
                     morph_results.append({
                         "sentence": piece_text,
                         "endings": ending_tokens,
@@ -251,7 +301,7 @@ def main():
                         "has_oov": has_oov,
                         "needs_manual_intent": needs_manual_intent
                     })
-    
+
             if skip_row:
                 continue
 
@@ -266,30 +316,95 @@ def main():
                     'has_oov': False,
                     'needs_manual_intent': True
                 })
-    
-            row['morph_results'] = json.dumps(morph_results, ensure_ascii=False)
-            processed_rows.append(row)
-            
-            # Incremental saving
-            if len(processed_rows) >= save_interval:
-                partial_df = pd.DataFrame(processed_rows)
-                # Append to partial file
-                header = not output_path_partial.exists()
-                partial_df.to_csv(output_path_partial, mode='a', header=header, index=False, encoding='utf-8-sig')
-                processed_rows = [] # Clear buffer
+
+            row['morph_results'] = json_dumps(morph_results)
+            # 세그먼트에서 나온 결과만 캐시 (빈 결과는 full_text에 따라 달라지고, 오류 난 행은 다시 로그를 남김)
+            if seg_cache is not None and segments and not had_error:
+                seg_cache[raw_segments] = row['morph_results']
+        processed_rows.append(row)
         
-        # Save remaining rows
-        if processed_rows:
-            partial_df = pd.DataFrame(processed_rows)
-            header = not output_path_partial.exists()
-            partial_df.to_csv(output_path_partial, mode='a', header=header, index=False, encoding='utf-8-sig')
+        # Incremental saving
+        if len(processed_rows) >= save_interval:
+            write_partial(processed_rows)
+            processed_rows = [] # Clear buffer
+    
+    # Save remaining rows
+    if processed_rows:
+        write_partial(processed_rows)
+    if partial_file is not None:
+        partial_file.close()
+    
+    if counts['duplicates'] > 0:
+        print(f"  - 중복 제거됨: {counts['duplicates']}개 행 (기준: {counts['target_col']})")
+    
+    # Skip processed rows
+    if start_idx > 0:
+        if start_idx >= counts['total']:
+            print("  ✅ 모든 데이터가 이미 처리되었습니다.")
+            # Rename partial to final if needed?
+            # If final doesn't exist but partial does and is complete.
+            if not output_path.exists():
+                output_path_partial.replace(output_path)
+                print(f"  -> 저장 완료: {output_path}")
+            return
         
-        # Rename partial to final
-        if output_path_partial.exists():
-            output_path_partial.replace(output_path)
-            print(f"  -> 저장 완료: {output_path}")
-        else:
-            print("  -> 저장할 데이터가 없습니다.")
+        print(f"  -> 남은 {counts['total'] - start_idx}개 행을 처리했습니다.")
+    
+    # Rename partial to final
+    if output_path_partial.exists():
+        output_path_partial.replace(output_path)
+        print(f"  -> 저장 완료: {output_path}")
+    else:
+        print("  -> 저장할 데이터가 없습니다.")
+
+
+def process_file_logged(input_path, output_dir):
+    """워커 프로세스용: process_file의 출력(stdout)을 모아 문자열로 반환"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        process_file(input_path, output_dir)
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Morph 후처리 스크립트")
+    parser.add_argument("--interactive", action="store_true", help="대화형 모드로 실행하여 애매한 태그를 직접 확인합니다.")
+    parser.add_argument("--gallery", type=str, help="특정 갤러리/커뮤니티만 처리 (파일명에 포함된 문자열)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Morph 후처리 시작")
+    if args.interactive:
+        print("📢 대화형 모드 활성화: 확률 0.92 이하인 EC 태그에 대해 확인을 요청합니다.")
+    if args.gallery:
+        print(f"필터 적용: '{args.gallery}'")
+    print("=" * 60)
+
+    input_dir = Path("data/processed/tagged")
+    output_dir = Path("data/processed/morph")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    all_files = list(input_dir.glob("tagged_*.csv"))
+    if args.gallery:
+        input_files = [f for f in all_files if args.gallery in f.name]
+    else:
+        input_files = all_files
+    
+    if not input_files:
+        print(f"\n❌ 오류: 처리할 파일이 없습니다. (필터: {args.gallery})")
+        return
+
+    print(f"발견된 파일: {len(input_files)}개")
+
+    if args.interactive or len(input_files) == 1:
+        for input_path in input_files:
+            process_file(input_path, output_dir, interactive=args.interactive)
+    else:
+        # 비대화형 모드는 파일끼리 독립적이므로 프로세스 병렬 처리 (로그는 파일 순서대로 출력)
+        max_workers = min(len(input_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for log in executor.map(process_file_logged, input_files, repeat(output_dir)):
+                print(log, end='')
 
     print("\n" + "=" * 60)
     print("✅ Morph 후처리 완료")
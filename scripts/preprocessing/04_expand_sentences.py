@@ -6,8 +6,9 @@
 03_process_morph.py에서 생성한 문장별 분석 결과를
 개별 행으로 확장합니다.
 
-Input: data/processed/all_communities_morph.csv (sentence_results 컬럼 포함)
-Output: data/processed/all_communities_expanded.csv (문장별로 확장된 데이터)
+Input: data/processed/morph/morph_{community}.csv (sentence_results 컬럼 포함)
+Output: data/processed/expanded/expanded_{community}.csv (문장별로 확장된 데이터, --parquet이면 .parquet)
+        05_prepare_intent.py가 이 파일들을 모두 읽어 합칩니다.
 """
 
 import pandas as pd
@@ -18,6 +19,12 @@ import sys
 
 import argparse
 
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from utils.json_utils import json_loads, json_dumps
+
+
 # 어미 정규화 매핑 (분석 시 같은 것으로 취급할 어미들)
 ENDING_MAPPING = {
     'ㅁ': '(으)ㅁ',
@@ -46,12 +53,107 @@ def normalize_ending(ending):
     """종결 어미를 정규화합니다."""
     return ENDING_MAPPING.get(ending, ending)
 
+
+def normalize_endings(endings, _get=ENDING_MAPPING.get):
+    """
+    종결 어미 토큰 리스트의 morph를 정규화합니다. (morph, tag, prob, oov) 형태 유지
+    토큰마다 normalize_ending을 호출하지 않고 dict.get을 바로 사용
+    """
+    return [
+        (_get(e[0], e[0]), e[1], e[2], e[3]) if len(e) >= 4
+        else (_get(e[0], e[0]), e[1]) if len(e) >= 2
+        else e
+        for e in endings
+    ]
+
+# 문장별 결과에 반드시 있어야 하는 키 (없으면 해당 행 파싱 오류로 처리)
+REQUIRED_RESULT_KEYS = ('endings', 'punctuation', 'other_symbols')
+
 print(f"ℹ️ 어미 정규화 매핑 로드 완료: {len(ENDING_MAPPING)}개 패턴")
 
 
+def expand_sentences(df, desc=None):
+    """
+    morph_results(문장별 분석 결과 리스트)를 문장 하나당 한 행으로 확장한 DataFrame 반환
+
+    JSON은 컬럼 단위로 한 번에 파싱하고, explode로 펼친 뒤 원본 행 안에서 같은 문장은
+    첫 번째만 남깁니다. 결과가 없는 행은 full_text를 문장으로 하는 행 하나로 채웁니다.
+    """
+    parsed = []
+    keep = []
+    for value in tqdm(df['morph_results'].tolist(), desc=desc):
+        try:
+            parsed.append(json_loads(value))
+            keep.append(True)
+        except json.JSONDecodeError as e:
+            print(f"\n⚠️  경고: 행 파싱 오류 - {e}")
+            parsed.append(None)
+            keep.append(False)
+
+    if 'timestamp' in df.columns:
+        timestamps = df['timestamp'].tolist()
+    elif 'posted_at' in df.columns:
+        timestamps = df['posted_at'].tolist()
+    else:
+        timestamps = [''] * len(df)
+
+    base = pd.DataFrame({
+        'community': df['community'].tolist(),
+        'full_text': df['full_text'].tolist(),
+        'timestamp': timestamps,
+        '_results': parsed,
+        '_fallback': [not results for results in parsed],
+    })[keep]
+    # 문장별 결과 하나당 한 행 (index는 원본 행 번호 그대로)
+    exp = base.explode('_results')
+
+    results = exp['_results'].tolist()
+    full_texts = exp['full_text'].tolist()
+    fallback = exp['_fallback'].tolist()
+    sentences = [
+        full_text if is_fallback else result.get('sentence', full_text)
+        for result, full_text, is_fallback in zip(results, full_texts, fallback)
+    ]
+
+    # 원본 행 안에서 같은 문장은 첫 번째만 유지
+    # 필수 키가 빠진 결과가 나오면 경고 후 그 행의 나머지 문장은 버림
+    duplicated = pd.DataFrame({'row': exp.index, 'sentence': sentences}).duplicated().to_numpy()
+    missing = [
+        None if is_dup or is_fallback else next((key for key in REQUIRED_RESULT_KEYS if key not in result), None)
+        for result, is_dup, is_fallback in zip(results, duplicated, fallback)
+    ]
+    bad = pd.Series([key is not None for key in missing], index=exp.index)
+    for key in (key for key in missing if key is not None):
+        print(f"\n⚠️  경고: 행 파싱 오류 - {KeyError(key)}")
+    cut = bad.groupby(level=0).cummax().to_numpy()
+    selected = ~duplicated & ~cut
+
+    exp = exp[selected]
+    results = [result for result, ok in zip(results, selected) if ok]
+    fallback = [is_fallback for is_fallback, ok in zip(fallback, selected) if ok]
+    sentences = [sentence for sentence, ok in zip(sentences, selected) if ok]
+
+    return pd.DataFrame({
+        'community': exp['community'].tolist(),
+        'full_text': exp['full_text'].tolist(),
+        'timestamp': exp['timestamp'].tolist(),
+        'sentence': sentences,
+        # 어미 정규화 적용 (morph, tag, prob, oov)
+        'all_endings': ['[]' if fb else json_dumps(normalize_endings(r['endings'])) for r, fb in zip(results, fallback)],
+        'intent': [''] * len(results),
+        'punctuation': ['[]' if fb else json_dumps(r['punctuation']) for r, fb in zip(results, fallback)],
+        'symbols': ['[]' if fb else json_dumps(r['other_symbols']) for r, fb in zip(results, fallback)],
+        'min_prob': [1.0 if fb else r.get('min_prob', 1.0) for r, fb in zip(results, fallback)],
+        'last_token_prob': [1.0 if fb else r.get('last_token_prob', 1.0) for r, fb in zip(results, fallback)],
+        'has_oov': [False if fb else r.get('has_oov', False) for r, fb in zip(results, fallback)],
+        'needs_manual_intent': [True if fb else r.get('needs_manual_intent', False) for r, fb in zip(results, fallback)],
+    })
+
+
 def main():
     parser = argparse.ArgumentParser(description="문장 단위 확장 스크립트")
     parser.add_argument("--gallery", type=str, help="특정 갤러리/커뮤니티만 처리 (파일명에 포함된 문자열)")
+    parser.add_argument("--parquet", action="store_true", help="CSV 대신 Parquet(zstd)로 저장합니다. (pyarrow 필요, 노트북은 CSV를 읽음)")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -81,7 +183,7 @@ def main():
         print(f"\n처리 중: {input_path.name}")
         
         community_name = input_path.stem.replace("morph_", "")
-        output_filename = f"expanded_{community_name}.csv"
+        output_filename = f"expanded_{community_name}.{'parquet' if args.parquet else 'csv'}"
         output_path = output_dir / output_filename
         
         print(f"데이터 로드 중: {input_path}")
@@ -90,75 +192,18 @@ def main():
         
         # sentence_results를 파싱하여 개별 행으로 확장
         print("문장 단위로 확장 중...")
-        new_rows = []
-        
-        for _, row in tqdm(df.iterrows(), total=len(df), desc=f"{community_name} 확장"):
-            try:
-                sentence_results = json.loads(row['morph_results'])
-                
-                timestamp_value = row.get('timestamp', row.get('posted_at'))
-                if timestamp_value is None:
-                    timestamp_value = ''
-    
-                if sentence_results:
-                    seen_sentences = set()
-                    for sent_res in sentence_results:
-                        sentence_text = sent_res.get('sentence', row['full_text'])
-                        if sentence_text in seen_sentences:
-                            continue
-                        seen_sentences.add(sentence_text)
-                        # 어미 정규화 적용 (morph, tag, prob, oov)
-                        normalized_endings = [
-                            (normalize_ending(e[0]), e[1], e[2], e[3]) if len(e) >= 4
-                            else (normalize_ending(e[0]), e[1]) if len(e) >= 2
-                            else e
-                            for e in sent_res['endings']
-                        ]
-                        new_row = {
-                            'community': row['community'],
-                            'full_text': row['full_text'],
-                            'timestamp': timestamp_value,
-                            'sentence': sentence_text,
-                            'all_endings': json.dumps(normalized_endings, ensure_ascii=False),
-                            'intent': '',
-                            'punctuation': json.dumps(sent_res['punctuation'], ensure_ascii=False),
-                            'symbols': json.dumps(sent_res['other_symbols'], ensure_ascii=False),
-                            'min_prob': sent_res.get('min_prob', 1.0),
-                            'last_token_prob': sent_res.get('last_token_prob', 1.0),
-                            'has_oov': sent_res.get('has_oov', False),
-                            'needs_manual_intent': sent_res.get('needs_manual_intent', False),
-                        }
-                        new_rows.append(new_row)
-                else:
-                    # 분석 결과가 없는 경우
-                    new_row = {
-                        'community': row['community'],
-                        'full_text': row['full_text'],
-                        'timestamp': timestamp_value,
-                        'sentence': row.get('full_text', ''),
-                        'all_endings': '[]',
-                        'intent': '',
-                        'punctuation': '[]',
-                        'symbols': '[]',
-                        'min_prob': 1.0,
-                        'last_token_prob': 1.0,
-                        'has_oov': False,
-                        'needs_manual_intent': True,
-                    }
-                    new_rows.append(new_row)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"\n⚠️  경고: 행 파싱 오류 - {e}")
-                continue
-        
-        # 새로운 DataFrame 생성
-        expanded_df = pd.DataFrame(new_rows)
+        expanded_df = expand_sentences(df, desc=f"{community_name} 확장")
         
         print(f"확장 완료:")
         print(f"  원본 행 수: {len(df)}")
         print(f"  확장 후 행 수: {len(expanded_df)}")
         
         # 저장
-        expanded_df.to_csv(output_path, index=False, encoding='utf-8')
+        if args.parquet:
+            # JSON 컬럼은 문자열 그대로 두고, 다시 읽을 때 CSV 파싱/dtype 추론을 하지 않도록 Parquet로 저장
+            expanded_df.to_parquet(output_path, index=False, engine='pyarrow', compression='zstd')
+        else:
+            expanded_df.to_csv(output_path, index=False, encoding='utf-8')
         print(f"  -> 저장 완료: {output_path}")
     
     print("\n" + "=" * 60)
@@ -6,23 +6,30 @@
 문장 단위 확장 결과에서 종결 어미 목록을 보강하고,
 라벨링/분석에 쓸 `real_ending`을 추가합니다.
 
-Input: data/processed/all_communities_expanded.csv
+Input: data/processed/expanded/expanded_{community}.csv (04_expand_sentences.py 출력, --parquet이면 .parquet)
 Output: data/processed/all_communities_intent.csv
 """
 
+import argparse
 import json
-import re
+import sys
 from pathlib import Path
 
 import pandas as pd
 from tqdm import tqdm
 
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from utils.json_utils import json_loads, json_dumps
+
 
 def strip_trailing_punct(text):
     """문장 끝의 공백/문장부호를 제거한 문자열 반환"""
     if not isinstance(text, str):
         return ''
-    return re.sub(r'[\.!?~…]+$', '', text.strip()).rstrip()
+    # 정규식 없이 str.rstrip으로 끝의 문장부호만 제거 ('[.!?~…]+$' 치환과 같은 결과)
+    return text.strip().rstrip('.!?~…').rstrip()
 
 
 def build_real_ending(endings):
@@ -38,7 +45,7 @@ def normalize_list_column(value):
     if pd.isna(value) or value == '':
         return []
     try:
-        parsed = json.loads(value)
+        parsed = json_loads(value)
         if isinstance(parsed, list):
             return parsed
     except json.JSONDecodeError:
@@ -47,43 +54,59 @@ def normalize_list_column(value):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Intent 데이터 생성 스크립트")
+    parser.add_argument("--parquet", action="store_true", help="04_expand_sentences.py --parquet로 만든 expanded_*.parquet를 읽습니다.")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Intent 데이터 생성 시작")
     print("=" * 60)
 
-    expanded_path = Path("data/processed/all_communities_expanded.csv")
+    # 04_expand_sentences.py가 커뮤니티별로 저장한 파일을 모두 읽어 합침
+    # (--parquet이면 CSV 파싱/dtype 추론 없이 Parquet를 읽음)
+    expanded_dir = Path("data/processed/expanded")
+    extension = 'parquet' if args.parquet else 'csv'
+    expanded_files = sorted(expanded_dir.glob(f"expanded_*.{extension}"))
     output_path = Path("data/processed/all_communities_intent.csv")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not expanded_path.exists():
-        print(f"\n❌ 오류: {expanded_path}가 존재하지 않습니다.")
-        print("먼저 scripts/preprocessing/04_expand_sentences.py를 실행하세요.")
+    if not expanded_files:
+        print(f"\n❌ 오류: {expanded_dir}에 expanded_*.{extension} 파일이 없습니다.")
+        print(f"먼저 scripts/preprocessing/04_expand_sentences.py{' --parquet' if args.parquet else ''}를 실행하세요.")
         return
 
-    print(f"\n데이터 로드 중: {expanded_path}")
-    df = pd.read_csv(expanded_path)
+    print(f"\n발견된 파일: {len(expanded_files)}개")
+    frames = []
+    for expanded_path in expanded_files:
+        print(f"데이터 로드 중: {expanded_path}")
+        if args.parquet:
+            frames.append(pd.read_parquet(expanded_path, engine='pyarrow'))
+        else:
+            frames.append(pd.read_csv(expanded_path))
+    df = pd.concat(frames, ignore_index=True)
     print(f"로드된 행 수: {len(df)}")
 
-    rows = []
     print("\nIntent 데이터 정리 중...")
-    for _, row in tqdm(df.iterrows(), total=len(df), desc="Intent 준비"):
-        sentence = row.get('sentence', '')
-        endings = normalize_list_column(row.get('all_endings', '[]'))
-        real_ending = build_real_ending(endings)
-
-        rows.append({
-            'community': row.get('community', ''),
-            'full_text': row.get('full_text', ''),
-            'timestamp': row.get('timestamp', ''),
-            'sentence': sentence,
-            'real_ending': json.dumps(real_ending, ensure_ascii=False) if real_ending else '[]',
-            'all_endings': json.dumps(endings, ensure_ascii=False),
-            'intent': row.get('intent', ''),
-            'punctuation': row.get('punctuation', '[]'),
-            'symbols': row.get('symbols', '[]'),
-        })
-
-    result_df = pd.DataFrame(rows)
+    # 행마다 dict를 만들지 않고 컬럼별 리스트로 바로 구성
+    def column(name, default=''):
+        return df[name].tolist() if name in df.columns else [default] * len(df)
+
+    raw_endings = column('all_endings', '[]')
+    endings = [normalize_list_column(value) for value in tqdm(raw_endings, desc="Intent 준비")]
+    real_endings = [build_real_ending(ending_list) for ending_list in endings]
+
+    result_df = pd.DataFrame({
+        'community': column('community'),
+        'full_text': column('full_text'),
+        'timestamp': column('timestamp'),
+        'sentence': column('sentence'),
+        'real_ending': [json_dumps(real_ending) if real_ending else '[]' for real_ending in real_endings],
+        # 파싱에 성공한 리스트는 원래 JSON 문자열을 그대로 기록 (다시 직렬화하지 않음)
+        'all_endings': [raw if ending_list else '[]' for raw, ending_list in zip(raw_endings, endings)],
+        'intent': column('intent'),
+        'punctuation': column('punctuation', '[]'),
+        'symbols': column('symbols', '[]'),
+    })
     result_df.to_csv(output_path, index=False, encoding='utf-8')
 
     print("\n" + "=" * 60)
@@ -1,7 +1,7 @@
 
 import sys
 import pandas as pd
-import json
+import os
 from pathlib import Path
 import uuid
 
@@ -9,6 +9,71 @@ import uuid
 project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
 
+from utils.json_utils import json_loads
+from utils.review_utils import sentences_hash
+
+try:  # xlsxwriter가 있으면 constant_memory 모드로 한 행씩 디스크에 기록
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+
+def parse_sentence_results(value):
+    """sentence_results JSON 파싱 (실패하면 빈 리스트)"""
+    try:
+        return json_loads(value)
+    except:
+        return []
+
+
+def summarize_results(sentence_results):
+    """sentence_results에서 (편집용 문장 텍스트, needs_manual_intent, has_oov, min_prob)를 계산"""
+    # Join sentences with newline for easy editing in Excel
+    sentences_text = "\n".join([res['sentence'] for res in sentence_results])
+    
+    # Aggregate flags
+    needs_manual = False
+    has_oov = False
+    min_prob = 1.0
+    
+    for res in sentence_results:
+        if res.get('needs_manual_intent'):
+            needs_manual = True
+        if res.get('has_oov'):
+            has_oov = True
+        prob = res.get('min_prob', 1.0)
+        if prob < min_prob:
+            min_prob = prob
+    
+    return sentences_text, needs_manual, has_oov, min_prob
+
+
+def generate_ids(count):
+    """uuid4 형식의 고유 ID를 count개 생성 (행마다 uuid4()를 부르지 않고 os.urandom을 한 번만 호출)"""
+    buffer = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buffer[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def write_excel(df, output_path):
+    """
+    DataFrame을 엑셀 파일로 저장
+    xlsxwriter가 있으면 constant_memory 모드로 행 순서대로 기록하여 워크북 전체를 메모리에 두지 않습니다.
+    (pandas.to_excel은 열 단위로 셀을 쓰기 때문에 constant_memory 모드에서는 데이터가 빠지므로 직접 기록)
+    """
+    if xlsxwriter is None:
+        df.to_excel(output_path, index=False)
+        return
+
+    workbook = xlsxwriter.Workbook(str(output_path), {'constant_memory': True, 'strings_to_urls': False})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, list(df.columns))
+        for row_idx, values in enumerate(df.itertuples(index=False, name=None), start=1):
+            # 결측값(NaN/None)은 to_excel과 같게 빈 칸으로
+            worksheet.write_row(row_idx, 0, [None if pd.isna(value) else value for value in values])
+    finally:
+        workbook.close()
+
 def main():
     print("=" * 60)
     print("검토용 엑셀 파일 생성 (Export for Review)")
@@ -35,7 +100,7 @@ def main():
         # Add a unique ID if not present
         if 'id' not in df.columns:
             print(f"    Generating unique IDs for {input_path.name}...")
-            df['id'] = [str(uuid.uuid4()) for _ in range(len(df))]
+            df['id'] = generate_ids(len(df))
             # Save back to file
             df.to_csv(input_path, index=False, encoding='utf-8')
         
@@ -47,57 +112,38 @@ def main():
         
     df = pd.concat(all_dfs, ignore_index=True)
 
-    review_rows = []
-    
     print("Processing rows...")
-    for _, row in df.iterrows():
-        try:
-            sentence_results = json.loads(row['sentence_results'])
-        except:
-            sentence_results = []
-            
-        # Join sentences with newline for easy editing in Excel
-        sentences_text = "\n".join([res['sentence'] for res in sentence_results])
-        
-        # Aggregate flags
-        needs_manual = False
-        has_oov = False
-        min_prob = 1.0
-        
-        for res in sentence_results:
-            if res.get('needs_manual_intent'):
-                needs_manual = True
-            if res.get('has_oov'):
-                has_oov = True
-            prob = res.get('min_prob', 1.0)
-            if prob < min_prob:
-                min_prob = prob
-        
-        review_rows.append({
-            'id': row['id'],
-            'community': row.get('community', ''),
-            'posted_at': row.get('posted_at', ''),
-            'full_text': row.get('full_text', ''),
-            'sentences_text': sentences_text, # Editable column
-            'needs_manual_intent': needs_manual,
-            'has_oov': has_oov,
-            'min_prob': min_prob
-        })
-
-    review_df = pd.DataFrame(review_rows)
+    # 행마다 Series를 만들지 않고 컬럼을 리스트로 꺼내 한 번에 파싱/집계
+    parsed = [parse_sentence_results(value) for value in df['sentence_results'].tolist()]
+    summaries = [summarize_results(sentence_results) for sentence_results in parsed]
+
+    def column(name):
+        return df[name].tolist() if name in df.columns else [''] * len(df)
+
+    review_df = pd.DataFrame({
+        'id': df['id'].tolist(),
+        'community': column('community'),
+        'posted_at': column('posted_at'),
+        'full_text': column('full_text'),
+        'sentences_text': [summary[0] for summary in summaries], # Editable column
+        'needs_manual_intent': [summary[1] for summary in summaries],
+        'has_oov': [summary[2] for summary in summaries],
+        'min_prob': [summary[3] for summary in summaries],
+        'sentences_hash': [sentences_hash(summary[0]) for summary in summaries], # Do not edit
+    })
     
     # Sort by needs_manual_intent (True first) to prioritize review
     review_df = review_df.sort_values(by=['needs_manual_intent', 'min_prob'], ascending=[False, True])
 
     print(f"Saving to {output_path}...")
     try:
-        review_df.to_excel(output_path, index=False)
+        write_excel(review_df, output_path)
         print("✅ Export successful!")
         print(f"Total rows: {len(review_df)}")
         print(f"Rows needing manual review: {len(review_df[review_df['needs_manual_intent'] == True])}")
     except ImportError:
-        print("❌ Error: 'openpyxl' library is required to save as Excel.")
-        print("Please run: pip install openpyxl")
+        print("❌ Error: 'xlsxwriter' or 'openpyxl' library is required to save as Excel.")
+        print("Please run: pip install xlsxwriter")
     except Exception as e:
         print(f"❌ Error saving Excel: {e}")
 
@@ -1,7 +1,9 @@
 
 import sys
 import pandas as pd
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from tqdm import tqdm
 import ast
@@ -12,6 +14,12 @@ sys.path.insert(0, str(project_root))
 
 from utils.bareun_analyzer import BareunAnalyzer
 from utils.morph_analyzer import MorphAnalyzer
+from utils.json_utils import json_loads, json_dumps
+from utils.review_utils import sentences_hash
+
+# Bareun 재분석 요청을 동시에 보낼 스레드 수 (네트워크 대기 시간이 대부분)
+ANALYZE_WORKERS = 16
+
 
 def main():
     print("=" * 60)
@@ -43,8 +51,7 @@ def main():
         dfs[file_path] = df
         
         if 'id' in df.columns:
-            for idx, row in df.iterrows():
-                id_map[row['id']] = (file_path, idx)
+            id_map.update(zip(df['id'].tolist(), zip(repeat(file_path), df.index.tolist())))
     
     print(f"Loaded {len(id_map)} rows across {len(dfs)} files.")
     
@@ -60,40 +67,59 @@ def main():
     morph_analyzer = MorphAnalyzer()
     
     updated_count = 0
-    files_to_save = set()
+    # 파일별로 (index, sentence_results JSON)을 모아 두었다가 마지막에 한 번에 반영
+    updates = defaultdict(list)
+    pending = []  # 바뀐 행: (file_path, index, 새 문장 목록)
     
     print("\nApplying corrections...")
-    for _, row in tqdm(corrected_df.iterrows(), total=len(corrected_df)):
-        row_id = row['id']
+    # export 시 기록한 sentences_hash가 있으면 해시만 비교해 원본 JSON 재파싱을 건너뜀
+    # (해시 컬럼이 없는 예전 파일은 기존처럼 원본 문장과 직접 비교)
+    if 'sentences_hash' not in corrected_df.columns:
+        corrected_df['sentences_hash'] = None
+    corrected_rows = corrected_df[['id', 'sentences_text', 'sentences_hash']].itertuples(index=False, name=None)
+    for row_id, sentences_text, orig_hash in tqdm(corrected_rows, total=len(corrected_df)):
         if row_id not in id_map:
             continue
             
         file_path, original_idx = id_map[row_id]
-        df = dfs[file_path]
-        original_row = df.loc[original_idx]
         
         # Check if sentences changed
-        new_sentences_text = str(row['sentences_text']) if pd.notna(row['sentences_text']) else ""
+        new_sentences_text = str(sentences_text) if pd.notna(sentences_text) else ""
         
-        # Reconstruct original text for comparison (normalization might be needed)
-        try:
-            orig_results = json.loads(original_row['sentence_results'])
-            orig_sentences_text = "\n".join([res['sentence'] for res in orig_results])
-        except:
-            orig_sentences_text = ""
-            
-        # Normalize line endings and strip
-        if new_sentences_text.strip().replace('\r\n', '\n') == orig_sentences_text.strip().replace('\r\n', '\n'):
-            continue
+        if isinstance(orig_hash, str):
+            if sentences_hash(new_sentences_text) == orig_hash:
+                continue
+        else:
+            # Reconstruct original text for comparison (normalization might be needed)
+            try:
+                orig_results = json_loads(dfs[file_path].at[original_idx, 'sentence_results'])
+                orig_sentences_text = "\n".join([res['sentence'] for res in orig_results])
+            except:
+                orig_sentences_text = ""
+                
+            # Normalize line endings and strip
+            if new_sentences_text.strip().replace('\r\n', '\n') == orig_sentences_text.strip().replace('\r\n', '\n'):
+                continue
             
         # If changed, re-process
         new_sentences = [s.strip() for s in new_sentences_text.split('\n') if s.strip()]
+        pending.append((file_path, original_idx, new_sentences))
+
+    # Re-analyze with Bareun: 모든 문장을 스레드 풀로 겹쳐서 보내고 결과는 입력 순서대로 받음
+    # 같은 문장(짧은 답글, 정형 문구 등)은 한 번만 분석하도록 문장 텍스트 기준으로 중복 제거
+    unique_sentences = list(dict.fromkeys(sent for _, _, new_sentences in pending for sent in new_sentences))
+    with ThreadPoolExecutor(max_workers=ANALYZE_WORKERS) as executor:
+        analyzed = dict(zip(
+            unique_sentences,
+            tqdm(executor.map(analyzer.analyze, unique_sentences), total=len(unique_sentences)),
+        ))
+
+    for file_path, original_idx, new_sentences in pending:
         new_results = []
         
         for sent in new_sentences:
-            # Re-analyze with Bareun
             try:
-                tokens = analyzer.analyze(sent)
+                tokens = analyzed[sent]
                 # tokens: [(morph, tag, prob, oov), ...]
                 
                 # Re-run MorphAnalyzer logic
@@ -151,16 +177,19 @@ def main():
                     'needs_manual_intent': True
                 })
 
-        # Update DataFrame
-        df.at[original_idx, 'sentence_results'] = json.dumps(new_results, ensure_ascii=False)
+        updates[file_path].append((original_idx, json_dumps(new_results)))
         updated_count += 1
-        files_to_save.add(file_path)
+
+    # Update DataFrames (파일마다 한 번의 .loc 대입)
+    for file_path, items in updates.items():
+        indices, values = zip(*items)
+        dfs[file_path].loc[list(indices), 'sentence_results'] = list(values)
 
     print(f"\n✅ Updated {updated_count} rows.")
     
     # Save updated CSVs
     print("Saving updated files...")
-    for file_path in files_to_save:
+    for file_path in updates:
         print(f"  - Saving {file_path.name}...")
         dfs[file_path].to_csv(file_path, index=False, encoding='utf-8')
         
@@ -2,10 +2,22 @@
 Utils 패키지
 
 형태소 분석 및 전처리 파이프라인을 위한 유틸리티 클래스들을 제공합니다.
+클래스는 처음 접근할 때 import합니다. (bareunpy가 없어도 json_utils 등 보조 모듈은 쓸 수 있도록)
 """
 
-from .bareun_analyzer import BareunAnalyzer
-from .morph_analyzer import MorphAnalyzer
-from .data_pipeline import DataPipeline
+import importlib
+
+_LAZY_ATTRS = {
+    'BareunAnalyzer': 'bareun_analyzer',
+    'MorphAnalyzer': 'morph_analyzer',
+    'DataPipeline': 'data_pipeline',
+}
 
 __all__ = ['BareunAnalyzer', 'MorphAnalyzer', 'DataPipeline']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f'.{_LAZY_ATTRS[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,10 @@ Bareun 형태소 분석기 인스턴스를 Singleton 패턴으로 관리하여
 """
 
 import os
+import sys
+import threading
+from bisect import bisect_right
+from itertools import count
 from bareunpy import Tagger
 from dotenv import load_dotenv
 
@@ -17,17 +21,29 @@ class BareunAnalyzer:
     
     _instance = None
     _tagger = None
+    _lock = threading.Lock()
+    
+    # 만들어 둘 Tagger(gRPC 채널) 수: 여러 스레드의 요청이 한 연결에 몰리지 않도록 나눠 보냄
+    POOL_SIZE = 4
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
+            with cls._lock:
+                # 여러 스레드가 동시에 처음 생성해도 한 번만 초기화 (초기화가 끝난 뒤에 등록)
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
     
     def _initialize(self):
         """Bareun Tagger 초기화"""
-        load_dotenv()
+        # 이미 환경 변수에 있으면 (.env를 읽은 부모 프로세스에서 물려받은 경우 포함) .env 파싱 생략
+        # load_dotenv는 기존 환경 변수를 덮어쓰지 않으므로 결과는 같음
         api_key = os.getenv('BAREUN_API_KEY')
+        if not api_key:
+            load_dotenv()
+            api_key = os.getenv('BAREUN_API_KEY')
         
         if not api_key:
             raise ValueError("BAREUN_API_KEY not found in .env file")
@@ -36,6 +52,8 @@ class BareunAnalyzer:
         print(f"Bareun Tagger 초기화 중... ({server})")
         
         self._tagger = Tagger(api_key, server, 443)
+        self._taggers = [self._tagger] + [Tagger(api_key, server, 443) for _ in range(self.POOL_SIZE - 1)]
+        self._turn = count()
         print("✅ Bareun Tagger 초기화 완료")
     
     @property
@@ -43,6 +61,10 @@ class BareunAnalyzer:
         """Tagger 인스턴스 반환"""
         return self._tagger
     
+    def _next_tagger(self):
+        """요청마다 Tagger 풀에서 돌아가며 하나를 고름 (next(count())는 GIL 아래에서 원자적)"""
+        return self._taggers[next(self._turn) % len(self._taggers)]
+    
     def analyze(self, text):
         """
         텍스트를 형태소 분석합니다.
@@ -58,7 +80,7 @@ class BareunAnalyzer:
         
         try:
             # Use tags() to enable auto_spacing and auto_split
-            tagged = self._tagger.tags([text.strip()], auto_spacing=True, auto_split=True)
+            tagged = self._next_tagger().tags([text.strip()], auto_spacing=True, auto_split=True)
             
             if not tagged:
                 return []
@@ -71,18 +93,78 @@ class BareunAnalyzer:
                 return []
                 
             for sent in sentences:
-                for token in sent.tokens:
-                    for morph in token.morphemes:
-                        # (morph, tag, probability, out_of_vocab)
-                        prob = getattr(morph, 'probability', 0.0)
-                        oov = getattr(morph, 'out_of_vocab', 0)
-                        
-                        # Convert integer tag to string (e.g., 25 -> "NNP")
-                        tag_str = type(morph).Tag.Name(morph.tag)
-                        
-                        results.append((morph.text.content, tag_str, prob, oov))
+                results.extend(self._sentence_tokens(sent))
             
             return results
         except Exception as e:
             print(f"⚠️  Bareun 분석 오류: {e}")
             return []
+    
+    def analyze_batch(self, texts):
+        """
+        여러 텍스트를 한 번의 tags() 호출로 형태소 분석합니다.
+        
+        bareunpy의 Tagger.tags()는 입력 리스트를 '\n'.join()으로 이어 한 문서로 보내고,
+        요청의 encoding_type이 UTF32라서 결과 문장의 text.begin_offset은 그 문서 안의
+        코드 포인트(파이썬 str 인덱스) 위치입니다. 이 오프셋으로 어느 입력 텍스트의
+        문장인지 되짚어 배정합니다.
+        오프셋이 어느 입력 텍스트 범위에도 들지 않으면 (bareunpy의 이어 붙이는 방식이나
+        오프셋 단위가 바뀐 경우) 배정을 믿을 수 없으므로 텍스트별 analyze()로 다시 분석합니다.
+        
+        Args:
+            texts (list): 분석할 텍스트 리스트
+            
+        Returns:
+            list: 입력 순서대로 텍스트별 Bareun 분석 결과 (빈 텍스트는 [])
+        """
+        results = [[] for _ in texts]
+        indices = []
+        phrases = []
+        for i, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                indices.append(i)
+                phrases.append(text.strip())
+        
+        if not phrases:
+            return results
+        
+        # 문서 안에서 각 텍스트가 시작하는 위치 (텍스트 길이 + 줄바꿈 1자)
+        starts = []
+        offset = 0
+        for phrase in phrases:
+            starts.append(offset)
+            offset += len(phrase) + 1
+        
+        try:
+            tagged = self._next_tagger().tags(phrases, auto_spacing=True, auto_split=True)
+            sentences = tagged.sentences() if callable(tagged.sentences) else tagged.sentences
+            
+            for sent in sentences or []:
+                begin = sent.text.begin_offset
+                position = bisect_right(starts, begin) - 1
+                if not (0 <= position < len(phrases) and begin < starts[position] + len(phrases[position])):
+                    raise ValueError(f"문장 오프셋 {begin}이 입력 텍스트 범위를 벗어남")
+                results[indices[position]].extend(self._sentence_tokens(sent))
+            
+            return results
+        except Exception as e:
+            # 배치 전체가 실패하면 텍스트별로 다시 보내 문제 있는 텍스트만 비도록 함
+            print(f"⚠️  Bareun 배치 분석 오류: {e}")
+            return [self.analyze(text) for text in texts]
+    
+    @staticmethod
+    def _sentence_tokens(sent):
+        """Bareun 문장 하나의 형태소를 (morph, tag, probability, out_of_vocab) 튜플 리스트로 변환"""
+        tokens = []
+        for token in sent.tokens:
+            for morph in token.morphemes:
+                # (morph, tag, probability, out_of_vocab)
+                prob = getattr(morph, 'probability', 0.0)
+                oov = getattr(morph, 'out_of_vocab', 0)
+                
+                # Convert integer tag to string (e.g., 25 -> "NNP")
+                # 품사 문자열은 intern해 두어 이후 태그 비교/집합 조회가 같은 객체로 빠르게 끝나도록 함
+                tag_str = sys.intern(type(morph).Tag.Name(morph.tag))
+                
+                tokens.append((morph.text.content, tag_str, prob, oov))
+        return tokens
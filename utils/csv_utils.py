@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CSV 읽기 헬퍼
+
+pd.read_csv 기본값과 같은 값/dtype/결측값으로 CSV를 읽습니다.
+pyarrow가 있으면 멀티스레드 Arrow CSV 파서를 사용합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:  # pyarrow가 있으면 멀티스레드 CSV 파서 사용
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+# pd.read_csv가 기본으로 결측값(NaN)으로 읽는 문자열 (pandas 문서의 na_values 기본 목록)
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+
+# 날짜/시각 문자열 컬럼: timestamp로 추론하지 않고 원문 문자열 그대로 읽음
+# (pd.read_csv는 날짜를 파싱하지 않으며, 저장할 때 원래 형식이 바뀌지 않도록)
+STRING_COLUMNS = ('posted_at', 'timestamp')
+
+
+def read_csv(file_path, string_columns=STRING_COLUMNS):
+    """
+    CSV 파일을 pd.read_csv 기본값과 같은 값/dtype/결측값으로 읽습니다.
+    본문(content)에 줄바꿈이 들어 있는 따옴표 셀이 있으므로 newlines_in_values를 켭니다.
+    (pd.read_csv(engine='pyarrow')는 이 옵션을 넘길 수 없어 여러 줄 셀에서 파싱 오류가 남)
+
+    Args:
+        file_path (str or Path): CSV 파일 경로
+        string_columns (iterable): 문자열로 읽을 컬럼 이름 (파일에 없는 이름은 무시됨)
+
+    Returns:
+        pd.DataFrame: 읽은 데이터
+    """
+    if pa_csv is None:
+        return pd.read_csv(file_path)
+
+    column_types = {name: pa.string() for name in string_columns}
+    table = _read_arrow(file_path, column_types)
+    # 목록에 없는 컬럼이 날짜/시각으로 추론되면 그 컬럼도 문자열로 다시 읽음 (pd.read_csv와 같게)
+    temporal = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+    if temporal:
+        column_types.update({name: pa.string() for name in temporal})
+        table = _read_arrow(file_path, column_types)
+
+    # 값이 전부 비어 있는 컬럼은 pd.read_csv처럼 float64(NaN)로
+    table = table.cast(pa.schema([
+        field.with_type(pa.float64())
+        if pa.types.is_null(field.type) or (table.num_rows and column.null_count == table.num_rows)
+        else field
+        for field, column in zip(table.schema, table.columns)
+    ]))
+    return table.to_pandas().fillna(np.nan)  # 문자열 컬럼의 None도 NaN으로 통일
+
+
+def _read_arrow(file_path, column_types):
+    """pyarrow.csv로 읽기 (결측값 문자열은 pd.read_csv 기본값과 동일)"""
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        strings_can_be_null=True,
+        null_values=NA_VALUES,
+    )
+    return pa_csv.read_csv(file_path, parse_options=parse_options, convert_options=convert_options)
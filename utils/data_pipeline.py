@@ -7,36 +7,83 @@ DataPipeline: 전처리 파이프라인 클래스
 체계적으로 관리합니다.
 """
 
-import json
+import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from collections import Counter
+from itertools import chain
 
+from utils.bareun_analyzer import BareunAnalyzer
 from utils.morph_analyzer import MorphAnalyzer
+from utils.json_utils import json_loads, json_dumps
+from utils.csv_utils import read_csv
+
+
+def build_sentence_results(analyzer, text, tokens):
+    """
+    Bareun 토큰을 종결 어미 기준으로 나눠 문장별 결과 리스트로 변환합니다.
+    
+    Args:
+        analyzer (MorphAnalyzer): 후처리용 형태소 분석기
+        text (str): 원문 텍스트
+        tokens (list): Bareun 분석 결과 (morph, tag, probability, out_of_vocab)
+        
+    Returns:
+        list: 문장별 {'sentence', 'endings', 'punctuation', 'other_symbols'} 리스트
+    """
+    if not isinstance(text, str) or not tokens:
+        return []
+    
+    results = []
+    for piece_text, piece_tokens in analyzer.segment_sentence_by_endings(text.strip(), tokens):
+        punctuation, other_symbols = analyzer.extract_symbols(piece_text)
+        results.append({
+            'sentence': piece_text,
+            'endings': analyzer.extract_final_endings(piece_tokens),
+            'punctuation': punctuation,
+            'other_symbols': other_symbols
+        })
+    return results
+
+
+def build_results_shard(pairs):
+    """(text, tokens) 목록 하나를 처리 (프로세스 풀 작업 단위, 프로세스마다 MorphAnalyzer 생성)"""
+    analyzer = MorphAnalyzer()
+    return [build_sentence_results(analyzer, text, tokens) for text, tokens in pairs]
 
 
 class DataPipeline:
     """전처리 파이프라인 관리 클래스"""
     
-    def __init__(self, max_workers=20):
+    # 후처리(문장 분할, 기호 추출)를 프로세스로 나눌 최소 텍스트 수 (적으면 프로세스 시작 비용이 더 큼)
+    MIN_TEXTS_PER_PROCESS = 1000
+    
+    def __init__(self, max_workers=20, batch_size=64, process_workers=None):
         """
         DataPipeline 초기화
         
         Args:
             max_workers (int): 병렬 처리 워커 수
+            batch_size (int): Bareun API 한 번의 호출로 보낼 텍스트 수
+            process_workers (int): 후처리에 쓸 프로세스 수 (None이면 CPU 코어 수)
         """
         self.analyzer = MorphAnalyzer()
+        self.bareun = None  # analyze_morphology()에서 처음 필요할 때 초기화
         self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.process_workers = process_workers or os.cpu_count() or 1
         self.df = None
+        self._results = None  # self.df 행 순서와 같은 sentence_results 파싱 결과 (JSON 재파싱 생략용)
     
     def load_data(self, file_path):
         """
-        CSV 파일에서 데이터를 로드합니다.
+        CSV 파일에서 데이터를 로드합니다. (.parquet이면 Parquet로 읽음)
         
         Args:
-            file_path (str or Path): CSV 파일 경로
+            file_path (str or Path): CSV 또는 Parquet 파일 경로
             
         Returns:
             DataPipeline: 메서드 체이닝을 위한 self 반환
@@ -47,7 +94,11 @@ class DataPipeline:
             raise FileNotFoundError(f"❌ 오류: {file_path}가 존재하지 않습니다.")
         
         print(f"\\n데이터 로드 중: {file_path}")
-        self.df = pd.read_csv(file_path)
+        if file_path.suffix == '.parquet':
+            self.df = pd.read_parquet(file_path)
+        else:
+            self.df = read_csv(file_path)
+        self._results = None
         print(f"로드된 행 수: {len(self.df)}")
         
         return self
@@ -66,20 +117,65 @@ class DataPipeline:
         print("형태소 분석, 문형 분류, 기호 추출 중 (Bareun - 병렬 처리)...")
         print("=" * 60)
         
-        texts = self.df['full_text'].tolist()
+        if self.bareun is None:
+            self.bareun = BareunAnalyzer()
+        
+        # 재게시/정형 문구처럼 같은 글은 한 번만 분석 (앞뒤 공백을 뗀 텍스트 기준으로 중복 제거)
+        keys = [text.strip() if isinstance(text, str) else '' for text in self.df['full_text'].tolist()]
+        texts = list(dict.fromkeys(key for key in keys if key))
+        print(f"고유 텍스트: {len(texts)}개 (중복 {len(keys) - len(texts)}개 생략)")
+        
+        # batch_size개씩 묶어 한 번의 tags() 호출로 보냄 (텍스트마다 요청을 보내는 왕복 비용 절감)
+        chunks = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            results = list(tqdm(
-                executor.map(self.analyzer.analyze_text, texts),
-                total=len(texts),
-                desc="분석 진행"
-            ))
+            token_lists = list(chain.from_iterable(tqdm(
+                executor.map(self.bareun.analyze_batch, chunks),
+                total=len(chunks),
+                desc="분석 진행 (배치)"
+            )))
+        
+        # Bareun 호출(I/O)은 스레드로, 문장 분할/기호 추출(CPU)은 GIL을 피해 프로세스로 나눠 처리
+        pairs = list(zip(texts, token_lists))
+        workers = min(self.process_workers, len(pairs) // self.MIN_TEXTS_PER_PROCESS)
+        if workers > 1:
+            shard_size = -(-len(pairs) // workers)
+            shards = [pairs[i:i + shard_size] for i in range(0, len(pairs), shard_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                built = list(chain.from_iterable(executor.map(build_results_shard, shards)))
+        else:
+            built = build_results_shard(pairs)
+        
+        results_by_text = dict(zip(texts, built))
+        results = [results_by_text.get(key, []) for key in keys]
         
         # 결과를 JSON 형태로 저장
-        self.df['sentence_results'] = [json.dumps(r, ensure_ascii=False) for r in results]
+        self.df['sentence_results'] = [json_dumps(r) for r in results]
+        self._results = results
         
         return self
     
+    def _sentence_results(self):
+        """
+        행별 sentence_results를 파싱된 리스트로 반환합니다.
+        
+        analyze_morphology()에서 만든 결과가 있으면 그대로 쓰고,
+        없으면 (예: 저장된 파일을 다시 로드한 경우) JSON을 파싱합니다.
+        
+        Returns:
+            list: 행 순서대로 문장별 결과 리스트 (파싱 실패 시 [])
+        """
+        if self._results is not None and len(self._results) == len(self.df):
+            return self._results
+        
+        results = []
+        for sentence_results_json in self.df['sentence_results']:
+            try:
+                results.append(json_loads(sentence_results_json))
+            except:
+                results.append([])
+        return results
+    
     def filter_banmal(self):
         """
         반말 게시글만 필터링합니다.
@@ -97,9 +193,8 @@ class DataPipeline:
         initial_count = len(self.df)
         
         # sentence_results에서 첫 번째 문장의 endings를 추출하여 반말 여부 판별
-        def check_banmal(sentence_results_json):
+        def check_banmal(results):
             try:
-                results = json.loads(sentence_results_json)
                 if results and len(results) > 0:
                     endings = results[0].get('endings', [])
                     return MorphAnalyzer.is_banmal(endings)
@@ -107,8 +202,12 @@ class DataPipeline:
             except:
                 return False
         
-        self.df['is_banmal'] = self.df['sentence_results'].apply(check_banmal)
-        self.df = self.df[self.df['is_banmal'] == True].copy()
+        results = self._sentence_results()
+        mask = np.fromiter((check_banmal(r) == True for r in results), dtype=bool, count=len(results))
+        self._results = [r for r, keep in zip(results, mask) if keep]
+        # take()는 새 DataFrame을 한 번만 만들고 (불리언 인덱싱 + copy()는 두 번) 복사본 경고 대상도 아님
+        self.df = self.df.take(np.flatnonzero(mask))
+        self.df['is_banmal'] = True
         
         removed_count = initial_count - len(self.df)
         print(f"제거된 존댓말 글: {removed_count}개")
@@ -131,17 +230,15 @@ class DataPipeline:
         
         print("\\n" + "=" * 60)
         print("신조어 종결 어미 확인 중...")
-        neo_counts = {neo: 0 for neo in neologisms}
-        
-        for sentence_results_json in self.df['sentence_results']:
+        # 모든 종결 어미 형태소를 한 번에 세고 확인할 신조어만 꺼냄
+        ending_counts = Counter()
+        for results in self._sentence_results():
             try:
-                results = json.loads(sentence_results_json)
-                for sent_res in results:
-                    for morph, tag in sent_res.get('endings', []):
-                        if morph in neologisms:
-                            neo_counts[morph] += 1
+                # ending: (morph, tag, probability, out_of_vocab)
+                ending_counts.update(ending[0] for sent_res in results for ending in sent_res.get('endings', []))
             except:
                 continue
+        neo_counts = {neo: ending_counts[neo] for neo in neologisms}
         
         print("\\n신조어 빈도:")
         for neo, count in neo_counts.items():
@@ -152,6 +249,7 @@ class DataPipeline:
     def save(self, output_path):
         """
         처리된 데이터를 CSV 파일로 저장합니다.
+        확장자가 .parquet이면 Parquet(zstd)로 저장합니다. (pyarrow 필요)
         
         Args:
             output_path (str or Path): 저장 경로
@@ -169,7 +267,11 @@ class DataPipeline:
         if 'is_banmal' in self.df.columns:
             self.df = self.df.drop('is_banmal', axis=1)
         
-        self.df.to_csv(output_path, index=False, encoding='utf-8')
+        if output_path.suffix == '.parquet':
+            # sentence_results는 JSON 문자열 그대로 두고, 다시 읽을 때 CSV 파싱/dtype 추론을 하지 않도록 Parquet로 저장
+            self.df.to_parquet(output_path, index=False, engine='pyarrow', compression='zstd')
+        else:
+            self.df.to_csv(output_path, index=False, encoding='utf-8')
         
         print("\\n" + "=" * 60)
         print("✅ 형태소 분석 완료!")
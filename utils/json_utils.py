@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 직렬화 헬퍼
+
+sentence_results / sentence_segments 등 JSON 컬럼을 읽고 쓸 때 사용합니다.
+orjson이 있으면 C 구현을 쓰고, 없으면 표준 json으로 같은 결과를 냅니다.
+"""
+
+import json
+
+try:  # orjson이 있으면 JSON 파싱/직렬화에 사용 (C 구현)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(text):
+    """JSON 문자열 파싱 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # NaN 등 orjson이 거부하는 값은 표준 json으로 다시 시도 (기존 파일 호환, 오류 메시지 동일)
+    return json.loads(text)
+
+
+def json_dumps(value):
+    """
+    JSON 문자열로 직렬화 (한글은 이스케이프하지 않음)
+    구분자에 공백이 없는 compact 형식 ('["야","EF"]')으로 두 경로 모두 같은 문자열을 만듭니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
@@ -7,6 +7,38 @@ MorphAnalyzer: 후처리용 형태소 분석 유틸리티
 """
 
 import re
+from functools import lru_cache
+
+
+def _minimal_substrings(words):
+    """다른 단어를 포함하는 단어는 빼고 남은 단어들 (부분 문자열 포함 검사 결과는 같음)"""
+    return tuple(word for word in words if not any(other != word and other in word for other in words))
+
+
+@lru_cache(maxsize=4096)
+def _token_positions(sentence, morphs):
+    """
+    문장 안에서 각 형태소의 (시작, 끝) 위치를 순서대로 찾습니다.
+    짧은 답글처럼 같은 문장/토큰 조합이 반복되므로 (sentence, morphs) 기준으로 캐시합니다.
+    """
+    positions = []
+    cursor = 0
+    find = sentence.find
+    for morph in morphs:
+        if not morph:
+            positions.append((cursor, cursor))
+            continue
+        idx = find(morph, cursor)
+        if idx == -1:
+            # cursor 이후에 없으면 그 앞쪽에서만 다시 찾음
+            idx = find(morph, 0, cursor + len(morph) - 1)
+        if idx == -1:
+            positions.append((cursor, cursor))
+            continue
+        end = idx + len(morph)
+        positions.append((idx, end))
+        cursor = end
+    return tuple(positions)
 
 
 class MorphAnalyzer:
@@ -15,11 +47,21 @@ class MorphAnalyzer:
     # EF: 종결 어미만 수집 (ETN:명사형, ETM:관형사형 제외)
     FINAL_ENDING_TAGS = {'EF', 'ECF'}
     SPLIT_ENDING_TAGS = {'EF'}
-    SENTENCE_SPLIT_REGEX = r'(?<=[.!?])\s+'
+    # Bareun 품사 중 조사(J*)와 기호(S*) - 토큰마다 startswith를 호출하지 않고 집합으로 판별
+    JOSA_TAGS = frozenset({'JKS', 'JKC', 'JKG', 'JKO', 'JKB', 'JKV', 'JKQ', 'JX', 'JC'})
+    SYMBOL_TAGS = frozenset({'SF', 'SP', 'SS', 'SE', 'SO', 'SW', 'SL', 'SH', 'SN'})
+    SENTENCE_SPLIT_REGEX = re.compile(r'(?<=[.!?])\s+')
+    # _refine_tokens 보정 규칙에 쓰는 형태소 집합
+    ETN_TO_EF_MORPHS = frozenset({'ㅁ', '음', '기', '긔'})
+    LOW_PROB_EF_MORPHS = frozenset({'긔', '노', '나', '슨', '임'})
 
     # 모든 한글 자음 반복 패턴 포착 (ㅋㅋ, ㅎㅎ, ㅠㅠ, ㅅㅂ, ㅈㄴ 등)
     EMOTION_REGEX = re.compile(r'[ㄱ-ㅎㅏ-ㅣ]+')
     PUNCTUATION_REGEX = re.compile(r'[?!~…\.]+')
+    # 존댓말 어미 목록
+    POLITE_ENDINGS = ['인가요', '습니다', 'ㅂ니다', '까요', '나요', '죠', '요']
+    # is_banmal에서 실제로 검사할 어미 ('인가요', '까요', '나요'는 '요'를 포함하므로 제외)
+    POLITE_SUBSTRINGS = _minimal_substrings(POLITE_ENDINGS)
 
     def extract_final_endings(self, tokens):
         """
@@ -49,7 +91,7 @@ class MorphAnalyzer:
                         continue
                     next_morph, next_tag = next_token[0], next_token[1]
 
-                    if next_tag.startswith('J') or next_tag == 'EP':
+                    if next_tag in self.JOSA_TAGS or next_tag == 'EP':
                         endings.append(next_token)
                         lookahead += 1
                         idx = lookahead - 1
@@ -61,30 +103,20 @@ class MorphAnalyzer:
         return endings
 
     def _token_positions(self, sentence, tokens):
-        positions = []
-        cursor = 0
-        lowered = sentence
-        for token in tokens:
-            morph = token[0] if token and isinstance(token, (list, tuple)) else ''
-            if not morph:
-                positions.append((cursor, cursor))
-                continue
-            idx = lowered.find(morph, cursor)
-            if idx == -1:
-                idx = lowered.find(morph)
-            if idx == -1:
-                positions.append((cursor, cursor))
-                continue
-            end = idx + len(morph)
-            positions.append((idx, end))
-            cursor = end
-        return positions
+        morphs = tuple(token[0] if token and isinstance(token, (list, tuple)) else '' for token in tokens)
+        return _token_positions(sentence, morphs)
 
     def _refine_tokens(self, tokens, sentence=None, callback=None):
         """
         토큰 리스트를 순회하며 특정 조건(예: '긔' + 낮은 확률)일 때 태그를 수정합니다.
         callback이 제공되면 사용자에게 결정을 위임합니다.
         """
+        # 뒤에서부터 한 번 훑어 문장부호(S...)가 아닌 마지막 토큰 위치를 구해 둠
+        # (EC마다 뒤쪽 토큰을 다시 훑지 않도록)
+        last_meaningful = len(tokens) - 1
+        while last_meaningful >= 0 and len(tokens[last_meaningful]) >= 2 and tokens[last_meaningful][1] in self.SYMBOL_TAGS:
+            last_meaningful -= 1
+        
         refined = []
         for i, token in enumerate(tokens):
             # token: (morph, tag, prob, oov) or (morph, tag)
@@ -96,11 +128,11 @@ class MorphAnalyzer:
                 
                 # 0. ETN 자동 보정 규칙 (사용자 요청)
                 # 'ㅁ', '음'이 ETN일 때, 뒤에 조사(J...)가 오지 않으면 EF로 변경
-                if tag == 'ETN' and morph in {'ㅁ', '음', '기', '긔'}:
+                if tag == 'ETN' and morph in self.ETN_TO_EF_MORPHS:
                     is_followed_by_josa = False
                     if i + 1 < len(tokens):
                         next_token = tokens[i+1]
-                        if len(next_token) >= 2 and next_token[1].startswith('J'):
+                        if len(next_token) >= 2 and next_token[1] in self.JOSA_TAGS:
                             is_followed_by_josa = True
                     
                     if not is_followed_by_josa:
@@ -109,19 +141,12 @@ class MorphAnalyzer:
                 # 0-1. 문장 끝 EC 자동 보정
                 # 문장의 맨 마지막 토큰이 EC인 경우, 혹은 뒤에 문장부호(S...)만 있는 경우
                 # 어차피 ECF로 바뀔 것이므로 미리 ECF로 변경하여 대화형 모드에서 물어보지 않음.
-                if tag == 'EC':
-                    is_last_meaningful = True
-                    for j in range(i + 1, len(tokens)):
-                        if not tokens[j][1].startswith('S'):
-                            is_last_meaningful = False
-                            break
-                    
-                    if is_last_meaningful:
-                        new_tag = 'ECF'
+                if tag == 'EC' and i >= last_meaningful:
+                    new_tag = 'ECF'
 
                 # 1. 자동 보정 규칙 (기존 로직 유지 + '노' 추가)
                 # '긔', '노' 처리: 확률이 0.9 이하이면 EF로 강제 변환 (항상 적용)
-                if (morph == '긔' or morph == '노' or morph == '나' or morph == '슨' or morph == '임' ) and prob <= 0.9:
+                if morph in self.LOW_PROB_EF_MORPHS and prob <= 0.9:
                     new_tag = 'EF'
 
                 # 2. 대화형 보정 (callback 있을 때)
@@ -225,7 +250,7 @@ class MorphAnalyzer:
                         lookahead += 1
                         continue
                     next_tag = next_token[1]
-                    if next_tag.startswith('J') or next_tag == 'EP' or next_tag.startswith('S'):
+                    if next_tag in self.JOSA_TAGS or next_tag == 'EP' or next_tag in self.SYMBOL_TAGS:
                         buffer_tokens.append(next_token)
                         if positions[lookahead][1] > positions[lookahead][0]:
                             end_pos = positions[lookahead][1]
@@ -277,18 +302,10 @@ class MorphAnalyzer:
         if not isinstance(text, str):
             return [], []
 
-        punctuation = []
-        other_symbols = []
-
-        for match in self.EMOTION_REGEX.finditer(text):
-            sequence = match.group(0)[:3]
-            if sequence and sequence not in other_symbols:
-                other_symbols.append(sequence)
-
-        for match in self.PUNCTUATION_REGEX.finditer(text):
-            sequence = match.group(0)[:3]
-            if sequence and sequence not in punctuation:
-                punctuation.append(sequence)
+        # findall은 Match 객체 없이 일치 문자열만 C에서 바로 리스트로 만들어 줌
+        # dict.fromkeys로 처음 나온 순서를 유지하며 중복 제거 (리스트 in 검사 대신 해시 조회)
+        other_symbols = list(dict.fromkeys(sequence[:3] for sequence in self.EMOTION_REGEX.findall(text)))
+        punctuation = list(dict.fromkeys(sequence[:3] for sequence in self.PUNCTUATION_REGEX.findall(text)))
 
         return punctuation, other_symbols
 
@@ -299,7 +316,7 @@ class MorphAnalyzer:
         if not isinstance(text, str):
             return []
 
-        sentences = re.split(self.SENTENCE_SPLIT_REGEX, text)
+        sentences = self.SENTENCE_SPLIT_REGEX.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     @staticmethod
@@ -316,14 +333,18 @@ class MorphAnalyzer:
         if not endings:
             return False
         
-        polite_endings = ['요', '죠', '습니다', 'ㅂ니다', '까요', '나요', '인가요']
-        
         banmal_score = 0
         polite_score = 0
         
+        polite_substrings = MorphAnalyzer.POLITE_SUBSTRINGS
         for ending in endings:
             morph, tag = ending[0], ending[1]
-            is_polite = any(p in morph for p in polite_endings)
+            # 짧은 형태소에는 regex 호출보다 C 부분 문자열 검사 몇 번이 더 빠름
+            is_polite = False
+            for polite in polite_substrings:
+                if polite in morph:
+                    is_polite = True
+                    break
             
             if is_polite:
                 polite_score += 1
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수동 검토(review) 단계 공용 헬퍼
+
+01_export_for_review.py와 02_import_corrections.py가 같은 규칙을 쓰도록 한 곳에 둡니다.
+"""
+
+import hashlib
+
+
+def sentences_hash(text):
+    """편집용 문장 텍스트의 sha1 (앞뒤 공백 제거, 줄바꿈 정규화 후) - import 단계에서 변경 여부 판별용"""
+    return hashlib.sha1(text.strip().replace('\r\n', '\n').encode('utf-8')).hexdigest()